@@ -13,13 +13,14 @@ SECURITY FEATURES:
 - Request signing and validation
 """
 
-import hashlib
 import hmac
 import time
 from datetime import datetime
-from typing import Optional, List, Any, Dict
+from functools import lru_cache
+from typing import Optional, List, Any, Dict, Tuple
 
 import pyotp  # type: ignore
+from pyotp.utils import strings_equal  # type: ignore
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from pydantic import BaseModel, Field
 try:
@@ -56,7 +57,10 @@ EMERGENCY_RATE_LIMIT = 3  # max attempts per window
 RATE_LIMIT_WINDOW = 900  # 15 minutes in seconds
 SESSION_TIMEOUT = 1800  # 30 minutes
 MAX_TIMESTAMP_DRIFT = 300  # 5 minutes
+TOTP_VALID_WINDOW = 2  # accepted TOTP steps before/after the current one
 ALLOWED_ACTIONS = ["SAFE_MODE", "SHUTDOWN", "NORMAL", "MAINTENANCE"]
+SIGNATURE_HEX_LENGTH = 64  # hex-encoded HMAC-SHA256
+_LOWER_HEX_DIGITS = frozenset("0123456789abcdef")
 
 # Authorized IP addresses for emergency access (in production, these should be specific IPs)
 AUTHORIZED_IPS: List[str] = getattr(settings, 'EMERGENCY_ALLOWED_IPS', ["127.0.0.1", "localhost"])
@@ -91,31 +95,100 @@ async def check_rate_limit(redis_client: Any, client_ip: str) -> bool:
     return True
 
 
-async def verify_totp(totp_code: str, secret: str) -> bool:
-    """Verify TOTP code against the configured secret."""
+@lru_cache(maxsize=128)
+def _totp(secret: str) -> "pyotp.TOTP":
+    """Return the TOTP generator for a secret, built once and reused."""
+    return pyotp.TOTP(secret)  # type: ignore
+
+
+# secret -> (timecode, accepted codes); the codes only change when the step rolls over
+_totp_window_codes: Dict[str, Tuple[int, Tuple[str, ...]]] = {}
+
+
+def _accepted_totp_codes(secret: str, timecode: int) -> Tuple[str, ...]:
+    """Return the codes accepted at a timecode, generated once per TOTP step."""
+    cached = _totp_window_codes.get(secret)
+    if cached is None or cached[0] != timecode:
+        totp = _totp(secret)
+        codes = tuple(
+            totp.generate_otp(timecode + offset)
+            for offset in range(-TOTP_VALID_WINDOW, TOTP_VALID_WINDOW + 1)
+        )
+        cached = _totp_window_codes[secret] = (timecode, codes)
+    return cached[1]
+
+
+def verify_totp_sync(totp_code: str, secret: str) -> bool:
+    """Verify TOTP code against the configured secret (CPU-only, no I/O)."""
     try:
-        totp = pyotp.TOTP(secret)  # type: ignore
-        return totp.verify(totp_code, valid_window=2)  # type: ignore
+        timecode = _totp(secret).timecode(datetime.now())
+        codes = _accepted_totp_codes(secret, timecode)
+        # Compare against every candidate so timing does not reveal which step matched
+        return any([strings_equal(str(totp_code), code) for code in codes])
     except Exception as e:
         logger.error(f"TOTP verification failed: {e}")
         return False
 
 
+async def verify_totp(totp_code: str, secret: str) -> bool:
+    """Verify TOTP code against the configured secret."""
+    return verify_totp_sync(totp_code, secret)
+
+
+@lru_cache(maxsize=64)
+def _keyed_hmac(secret: str) -> "hmac.HMAC":
+    """Return an HMAC-SHA256 state already keyed with the secret (copied per request)."""
+    # A digest name (not the constructor) always selects OpenSSL's native HMAC
+    return hmac.new(secret.encode(), digestmod="sha256")
+
+
+def _signature_message(action: str, timestamp: int, totp: str) -> bytes:
+    """Bytes covered by a request signature."""
+    return b"%s:%d:%s" % (action.encode(), timestamp, totp.encode())
+
+
+def _signature_bytes(action: str, timestamp: int, totp: str, secret: str) -> bytes:
+    """Raw HMAC-SHA256 digest of a request; hex is only produced at the API boundary."""
+    # Copying the keyed state skips re-deriving the inner/outer pads per call
+    mac = _keyed_hmac(secret).copy()
+    mac.update(_signature_message(action, timestamp, totp))
+    return mac.digest()
+
+
 def generate_request_signature(action: str, timestamp: int, totp: str, secret: str) -> str:
     """Generate HMAC signature for request integrity."""
-    message = f"{action}:{timestamp}:{totp}"
-    signature = hmac.new(
-        secret.encode(),
-        message.encode(),
-        hashlib.sha256
-    ).hexdigest()
-    return signature
+    return _signature_bytes(action, timestamp, totp, secret).hex()
+
+
+def _decode_signature(signature: str) -> Optional[bytes]:
+    """Decode a hex signature, accepting only the canonical form (64 lowercase hex digits)."""
+    # bytes.fromhex alone would also accept uppercase digits and whitespace
+    if len(signature) != SIGNATURE_HEX_LENGTH or not _LOWER_HEX_DIGITS.issuperset(signature):
+        return None
+    return bytes.fromhex(signature)
 
 
 def verify_request_signature(action: str, timestamp: int, totp: str, signature: str, secret: str) -> bool:
     """Verify request signature for integrity."""
-    expected_signature = generate_request_signature(action, timestamp, totp, secret)
-    return hmac.compare_digest(expected_signature, signature)
+    provided = _decode_signature(signature)
+    if provided is None:
+        return False
+    return hmac.compare_digest(_signature_bytes(action, timestamp, totp, secret), provided)
+
+
+def verify_request_signatures_batch(items: List[Tuple[str, int, str, str]], secret: str) -> List[bool]:
+    """Verify many (action, timestamp, totp, signature) requests signed with the same secret."""
+    keyed = _keyed_hmac(secret)
+    results = []
+    for action, timestamp, totp, signature in items:
+        provided = _decode_signature(signature)
+        if provided is None:
+            results.append(False)
+            continue
+        mac = keyed.copy()
+        mac.update(_signature_message(action, timestamp, totp))
+        results.append(hmac.compare_digest(mac.digest(), provided))
+    return results
 
 
 async def log_emergency_action(redis_client: Any, action: str, client_ip: str, success: bool, details: str = ""):
@@ -136,10 +209,10 @@ async def log_emergency_action(redis_client: Any, action: str, client_ip: str, s
     await redis_client.setex(log_key, 7776000, str(log_entry))  # 90 days
 
 
-def verify_timestamp(timestamp: int) -> bool:
-    """Verify that timestamp is within acceptable drift."""
-    current_time = int(time.time())
-    return abs(current_time - timestamp) <= MAX_TIMESTAMP_DRIFT
+def verify_timestamp(timestamp: int, now: Optional[int] = None) -> bool:
+    """Verify that timestamp is within acceptable drift of ``now`` (defaults to the current time)."""
+    drift = (int(time.time()) if now is None else now) - timestamp
+    return -MAX_TIMESTAMP_DRIFT <= drift <= MAX_TIMESTAMP_DRIFT
 
 
 @router.post("/override", include_in_schema=False)
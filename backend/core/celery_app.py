@@ -8,6 +8,7 @@ include_tasks = [
     "backend.tasks.project_tasks",
     "backend.tasks.modification_tasks",
     "backend.tasks.periodic_tasks",
+    "backend.transformation.tasks",
 ]
 
 celery_app = Celery(
@@ -24,8 +25,33 @@ celery_app.conf.update(
     accept_content=["json"],
     timezone="UTC",
     enable_utc=True,
+    # The visibility timeout must outlast the longest late-acked task
+    # (transformation.validate is capped at 5 minutes plus clone/refactor
+    # time). 3600s is kombu's Redis default, so early-acked tasks on the
+    # default queue see no change in redelivery behaviour.
+    broker_transport_options={"visibility_timeout": 3600},
 )
 
+# A short broker poll interval keeps the clone -> refactor -> validate ->
+# create_pr hand-offs snappy. It is opt-in per process (only the transformation
+# worker sets it in docker-compose.yml) so idle workers do not poll the broker
+# many times per second.
+if settings.CELERY_BROKER_POLLING_INTERVAL is not None:
+    celery_app.conf.broker_transport_options["polling_interval"] = (
+        settings.CELERY_BROKER_POLLING_INTERVAL
+    )
+
+# Heavy transformation tasks get their own queue and dedicated worker so
+# cheap tasks on the default queue are never stuck behind them. That worker
+# runs with -Ofair --prefetch-multiplier=1 (see docker-compose.yml), and the
+# long-running ones ack late; every other task keeps Celery's defaults. The whole
+# pipeline (clone_and_scan -> refactor -> validate -> create_pr) must share a
+# queue: the tasks hand each other a local clone path (job["cloned_repo_path"])
+# that only exists on the worker that created it.
+celery_app.conf.task_routes = {
+    "transformation.*": {"queue": "transformation"},
+}
+
 # Celery Beat Schedule
 # This configures the scheduler to run tasks at specified intervals.
 celery_app.conf.beat_schedule = {
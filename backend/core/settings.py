@@ -39,6 +39,8 @@ class Settings(BaseSettings):
     # Celery settings - allow them to be None initially
     CELERY_BROKER_URL: Optional[str] = None
     CELERY_RESULT_BACKEND: Optional[str] = None
+    # Broker poll interval in seconds; unset keeps the transport default
+    CELERY_BROKER_POLLING_INTERVAL: Optional[float] = None
 
     # OpenAI API Key
     OPENAI_API_KEY: Optional[str] = None
@@ -27,6 +27,8 @@ logger = logging.getLogger(__name__)
 
 from .filters import analyze_prompt
 
+_LOWER_HEX_DIGITS = frozenset("0123456789abcdef")
+
 
 class SecurityContext(BaseModel):
     """Security context for requests"""
@@ -260,19 +262,25 @@ class SecurityEngine:
             signature = request.headers.get("x-signature")
             if not signature:
                 return False
+            # Only the canonical form is accepted: bytes.fromhex would also take
+            # uppercase digits and whitespace as spellings of the same MAC
+            if len(signature) != 64 or not _LOWER_HEX_DIGITS.issuperset(signature):
+                return False
+            provided_signature = bytes.fromhex(signature)
             
             # Reconstruct expected signature
             body = await request.body()
             timestamp = request.headers.get("x-timestamp", "")
-            payload = f"{timestamp}:{request.method}:{request.url}:{body.decode()}"
+            # Signed bytes are assembled directly; the body is never decoded and re-encoded
+            payload = b"%s:%s:%s:%s" % (
+                timestamp.encode(), request.method.encode(), str(request.url).encode(), body
+            )
             
-            expected_signature = hmac.new(
-                secret_key.encode(),
-                payload.encode(),
-                hashlib.sha256
-            ).hexdigest()
+            # One-shot digest runs entirely in OpenSSL without building an HMAC object
+            expected_signature = hmac.digest(secret_key.encode(), payload, "sha256")
             
-            return hmac.compare_digest(signature, expected_signature)
+            # Compare the 32 raw digest bytes rather than 64 hex characters
+            return hmac.compare_digest(provided_signature, expected_signature)
             
         except Exception as e:
             logger.error(f"Error validating request signature: {e}")
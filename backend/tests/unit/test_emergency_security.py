@@ -14,6 +14,7 @@ import pytest
 import asyncio
 import time
 import json
+import pyotp
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from fastapi import Request, HTTPException
 from fastapi.testclient import TestClient
@@ -30,10 +31,15 @@ sys.modules['backend.core.settings'] = MagicMock()
 
 # Now import our functions
 from backend.api.emergency import (
+    _accepted_totp_codes,
+    _totp,
+    _totp_window_codes,
     verify_timestamp,
     verify_totp,
+    verify_totp_sync,
     generate_request_signature,
     verify_request_signature,
+    verify_request_signatures_batch,
     verify_ip_allowlist,
     check_rate_limit,
     log_emergency_action,
@@ -43,6 +49,15 @@ from backend.api.emergency import (
 class TestEmergencySecurityFeatures:
     """Test suite for emergency security functions"""
     
+    @pytest.fixture(autouse=True)
+    def clear_totp_cache(self):
+        """Cached TOTP objects must not leak between tests that patch pyotp"""
+        _totp.cache_clear()
+        _totp_window_codes.clear()
+        yield
+        _totp.cache_clear()
+        _totp_window_codes.clear()
+    
     def test_timestamp_validation_success(self):
         """Test that current timestamps are accepted"""
         current_time = int(time.time())
@@ -50,44 +65,52 @@ class TestEmergencySecurityFeatures:
         
         # Test within acceptable drift (4 minutes ago)
         recent_time = current_time - 240
-        assert verify_timestamp(recent_time) == True
+        assert verify_timestamp(recent_time, now=current_time) == True
     
     def test_timestamp_validation_failure(self):
         """Test that old timestamps are rejected"""
         current_time = int(time.time())
         old_time = current_time - 400  # 6+ minutes ago
-        assert verify_timestamp(old_time) == False
+        assert verify_timestamp(old_time, now=current_time) == False
         
         future_time = current_time + 400  # 6+ minutes in future
-        assert verify_timestamp(future_time) == False
+        assert verify_timestamp(future_time, now=current_time) == False
+    
+    def test_timestamp_validation_boundaries(self):
+        """Test that the drift limit is inclusive in both directions"""
+        now = 1692358800
+        assert verify_timestamp(now - 300, now=now) == True
+        assert verify_timestamp(now + 300, now=now) == True
+        assert verify_timestamp(now - 301, now=now) == False
+        assert verify_timestamp(now + 301, now=now) == False
     
     @pytest.mark.asyncio
     async def test_totp_verification_success(self):
         """Test TOTP verification with valid codes"""
         secret = "JBSWY3DPEHPK3PXP"
+        totp = pyotp.TOTP(secret)
         
-        # Mock TOTP to return predictable value
-        with patch('pyotp.TOTP') as mock_totp:
-            mock_totp_instance = Mock()
-            mock_totp_instance.verify.return_value = True
-            mock_totp.return_value = mock_totp_instance
-            
-            result = await verify_totp("123456", secret)
-            assert result == True
-            mock_totp_instance.verify.assert_called_once_with("123456", valid_window=2)
+        assert await verify_totp(totp.now(), secret) == True
+        # Codes from the previous step are still inside the valid window
+        assert await verify_totp(totp.at(time.time() - 30), secret) == True
+    
+    def test_totp_verification_sync(self):
+        """Test the synchronous TOTP check used outside the event loop"""
+        secret = "JBSWY3DPEHPK3PXP"
+        totp = pyotp.TOTP(secret)
+        
+        assert verify_totp_sync(totp.now(), secret) == True
+        assert verify_totp_sync(totp.at(time.time() - 600), secret) == False
     
     @pytest.mark.asyncio
     async def test_totp_verification_failure(self):
         """Test TOTP verification with invalid codes"""
         secret = "JBSWY3DPEHPK3PXP"
+        totp = pyotp.TOTP(secret)
         
-        with patch('pyotp.TOTP') as mock_totp:
-            mock_totp_instance = Mock()
-            mock_totp_instance.verify.return_value = False
-            mock_totp.return_value = mock_totp_instance
-            
-            result = await verify_totp("000000", secret)
-            assert result == False
+        valid_codes = {totp.at(time.time(), offset) for offset in range(-2, 3)}
+        invalid_code = next(code for code in ("000000", "111111", "222222") if code not in valid_codes)
+        assert await verify_totp(invalid_code, secret) == False
     
     @pytest.mark.asyncio
     async def test_totp_verification_exception(self):
@@ -100,6 +123,29 @@ class TestEmergencySecurityFeatures:
             result = await verify_totp("123456", secret)
             assert result == False
     
+    @pytest.mark.asyncio
+    async def test_totp_instance_reused_per_secret(self):
+        """Test that repeated verifications reuse one TOTP object per secret"""
+        secret = "JBSWY3DPEHPK3PXP"
+        
+        with patch('pyotp.TOTP', wraps=pyotp.TOTP) as mock_totp:
+            code = pyotp.TOTP(secret).now()
+            mock_totp.reset_mock()
+            
+            assert await verify_totp(code, secret) == True
+            assert await verify_totp(code, secret) == True
+            mock_totp.assert_called_once_with(secret)
+    
+    def test_totp_window_codes_computed_once_per_step(self):
+        """Test that accepted codes match pyotp and are generated once per step"""
+        secret = "JBSWY3DPEHPK3PXP"
+        totp = pyotp.TOTP(secret)
+        
+        codes = _accepted_totp_codes(secret, 1000)
+        assert codes == tuple(totp.generate_otp(1000 + offset) for offset in range(-2, 3))
+        assert _accepted_totp_codes(secret, 1000) is codes
+        assert _accepted_totp_codes(secret, 1001) == tuple(totp.generate_otp(1001 + offset) for offset in range(-2, 3))
+    
     def test_request_signature_generation(self):
         """Test request signature generation"""
         action = "SAFE_MODE"
@@ -114,6 +160,19 @@ class TestEmergencySecurityFeatures:
         assert signature1 == signature2
         assert len(signature1) == 64  # SHA256 hex digest length
     
+    def test_request_signature_matches_reference_hmac(self):
+        """Test that the cached keyed HMAC matches a freshly keyed one"""
+        import hashlib
+        import hmac
+        
+        for secret in ("test_secret_key", "other_secret", "test_secret_key"):
+            expected = hmac.new(
+                secret.encode(),
+                b"SAFE_MODE:1692358800:123456",
+                hashlib.sha256
+            ).hexdigest()
+            assert generate_request_signature("SAFE_MODE", 1692358800, "123456", secret) == expected
+    
     def test_request_signature_verification_success(self):
         """Test successful request signature verification"""
         action = "SAFE_MODE"
@@ -146,6 +205,55 @@ class TestEmergencySecurityFeatures:
         # Test wrong secret
         assert verify_request_signature(action, timestamp, totp, signature, "wrong_secret") == False
     
+    def test_request_signature_batch_verification(self):
+        """Test batch verification matches per-request verification"""
+        timestamp = 1692358800
+        secret = "test_secret_key"
+        
+        good = ("SAFE_MODE", timestamp, "123456", generate_request_signature("SAFE_MODE", timestamp, "123456", secret))
+        other = ("SHUTDOWN", timestamp, "654321", generate_request_signature("SHUTDOWN", timestamp, "654321", secret))
+        tampered = ("NORMAL", timestamp, "123456", good[3])
+        malformed = ("SAFE_MODE", timestamp, "123456", "zz")
+        items = [good, tampered, other, malformed]
+        
+        assert verify_request_signatures_batch(items, secret) == [True, False, True, False]
+        assert verify_request_signatures_batch(items, secret) == [
+            verify_request_signature(action, ts, totp, sig, secret) for action, ts, totp, sig in items
+        ]
+        assert verify_request_signatures_batch([], secret) == []
+    
+    def test_request_signature_verification_malformed(self):
+        """Test that non-hex or truncated signatures are rejected without raising"""
+        action = "SAFE_MODE"
+        timestamp = 1692358800
+        totp = "123456"
+        secret = "test_secret_key"
+        
+        signature = generate_request_signature(action, timestamp, totp, secret)
+        
+        assert verify_request_signature(action, timestamp, totp, "not-a-signature", secret) == False
+        assert verify_request_signature(action, timestamp, totp, "é" * 64, secret) == False
+        assert verify_request_signature(action, timestamp, totp, signature[:-2], secret) == False
+        assert verify_request_signature(action, timestamp, totp, "", secret) == False
+    
+    def test_request_signature_verification_non_canonical_hex(self):
+        """Test that uppercase or whitespace-padded spellings of a valid signature are rejected"""
+        action = "SAFE_MODE"
+        timestamp = 1692358800
+        totp = "123456"
+        secret = "test_secret_key"
+        
+        signature = generate_request_signature(action, timestamp, totp, secret)
+        spaced = " ".join(signature[i:i + 2] for i in range(0, len(signature), 2))
+        variants = [signature.upper(), f" {signature} ", f"{signature}\n", spaced]
+        
+        assert verify_request_signature(action, timestamp, totp, signature, secret) == True
+        for variant in variants:
+            assert verify_request_signature(action, timestamp, totp, variant, secret) == False
+        assert verify_request_signatures_batch(
+            [(action, timestamp, totp, variant) for variant in variants], secret
+        ) == [False] * len(variants)
+    
     @pytest.mark.asyncio
     async def test_ip_allowlist_success(self):
         """Test IP allowlist allows authorized IPs"""
@@ -297,21 +405,22 @@ async def test_performance_benchmarks():
     """Performance benchmark tests"""
     import time
     
-    # Test signature generation performance
-    start = time.perf_counter()
-    for i in range(1000):
-        generate_request_signature("SAFE_MODE", 1692358800, "123456", f"secret_{i}")
-    signature_time = (time.perf_counter() - start) * 1000  # ms
+    # Test signature generation performance (inputs built outside the timed region)
+    secrets = [f"secret_{i}" for i in range(1000)]
+    start = time.perf_counter_ns()
+    for secret in secrets:
+        generate_request_signature("SAFE_MODE", 1692358800, "123456", secret)
+    signature_time = (time.perf_counter_ns() - start) / 1_000_000  # ms
     
     # Should be under 100ms for 1000 operations
     assert signature_time < 100
     
     # Test timestamp validation performance
     current_time = int(time.time())
-    start = time.perf_counter()
+    start = time.perf_counter_ns()
     for i in range(10000):
         verify_timestamp(current_time)
-    timestamp_time = (time.perf_counter() - start) * 1000  # ms
+    timestamp_time = (time.perf_counter_ns() - start) / 1_000_000  # ms
     
     # Should be under 10ms for 10000 operations
     assert timestamp_time < 10
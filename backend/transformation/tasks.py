@@ -4,8 +4,17 @@ workflow, such as cloning, scanning, refactoring, and validating.
 """
 
 import asyncio
+import fcntl
+import hashlib
+import os
+import shutil
+import signal
 import subprocess
 import tempfile
+import threading
+from collections import deque
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
 
 import git
 
@@ -21,8 +30,109 @@ from backend.transformation.orchestration import (
 
 log = get_logger(__name__)
 
+VALIDATION_TIMEOUT_SECONDS = 300  # 5-minute timeout for tests
+VALIDATION_OUTPUT_MAX_LINES = 2000  # Only the tail of the test output is kept
 
-@celery_app.task(bind=True, name="transformation.refactor")
+# Bare mirrors of cloned repositories, shared by all jobs on this worker host
+REPO_CACHE_ROOT = Path(
+    os.environ.get(
+        "REPO_CACHE_ROOT", os.path.join(tempfile.gettempdir(), "zerodev-repo-cache")
+    )
+)
+# Never prompt for credentials; fail fast instead
+GIT_ENV = {"GIT_TERMINAL_PROMPT": "0"}
+# Long-running tasks are acknowledged only after they finish, so a task lost
+# with its worker is redelivered instead of silently dropped. create_pr is a
+# short, non-idempotent API call (a redelivery could open a second PR) and
+# keeps the default early ack.
+_LONG_TASK_OPTIONS = {"acks_late": True, "reject_on_worker_lost": True}
+
+
+def _strip_credentials(repo_url: str) -> str:
+    """Returns repo_url without any user:token@ part, for storing on disk."""
+    parts = urlsplit(repo_url)
+    if not parts.username and not parts.password:
+        return repo_url
+    netloc = parts.hostname or ""
+    if parts.port:
+        netloc = f"{netloc}:{parts.port}"
+    return urlunsplit(parts._replace(netloc=netloc))
+
+
+def _ensure_cache_root() -> None:
+    """
+    Creates REPO_CACHE_ROOT as a private (0700) directory owned by this user.
+
+    The default location is under the shared system temp dir, so refuse to
+    use a directory that another user created there first.
+    """
+    REPO_CACHE_ROOT.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = REPO_CACHE_ROOT.stat()
+    if st.st_uid != os.getuid():
+        raise PermissionError(
+            f"Repository cache {REPO_CACHE_ROOT} is not owned by the current user"
+        )
+    if st.st_mode & 0o077:
+        REPO_CACHE_ROOT.chmod(0o700)
+
+
+def _create_mirror(repo_url: str, mirror_path: Path) -> None:
+    """
+    Clones a bare mirror next to mirror_path and moves it into place.
+
+    A worker killed mid-clone only leaves a stray temp dir behind, never a
+    half-written mirror at mirror_path. The stored origin URL carries no
+    credentials.
+    """
+    tmp_path = Path(
+        tempfile.mkdtemp(prefix=f"{mirror_path.stem}.", dir=REPO_CACHE_ROOT)
+    )
+    try:
+        mirror = git.Repo.clone_from(repo_url, tmp_path, mirror=True, env=GIT_ENV)
+        mirror.remotes.origin.set_url(_strip_credentials(repo_url))
+        os.replace(tmp_path, mirror_path)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+
+def _clone_from_cache(repo_url: str, dest: str) -> None:
+    """
+    Clones repo_url into dest through a local bare mirror.
+
+    The first job for a repository creates the mirror; later jobs only fetch
+    new objects into it and then clone locally (objects are hardlinked).
+    A file lock serialises jobs that target the same repository. A mirror
+    that cannot be fetched is assumed to be damaged and is re-cloned once.
+    """
+    _ensure_cache_root()
+    key = hashlib.sha1(_strip_credentials(repo_url).encode()).hexdigest()
+    mirror_path = REPO_CACHE_ROOT / f"{key}.git"
+
+    with open(REPO_CACHE_ROOT / f"{key}.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        if mirror_path.exists():
+            try:
+                # The stored origin has no credentials, so pass the real URL
+                git.Git(str(mirror_path)).fetch(
+                    "--prune", repo_url, "+refs/*:refs/*", env=GIT_ENV
+                )
+            except git.exc.GitCommandError:
+                log.warning(f"Fetch into mirror {mirror_path} failed; re-cloning it")
+                shutil.rmtree(mirror_path, ignore_errors=True)
+                _create_mirror(repo_url, mirror_path)
+        else:
+            _create_mirror(repo_url, mirror_path)
+
+        repo = git.Repo.clone_from(
+            str(mirror_path), dest, local=True, single_branch=True, no_tags=True
+        )
+
+    # Point origin back at the real remote so the PR branch is pushed there
+    repo.remotes.origin.set_url(repo_url)
+
+
+@celery_app.task(bind=True, name="transformation.refactor", **_LONG_TASK_OPTIONS)
 def refactor_task(self, job_id: str):
     """
     Celery task to perform refactoring on the codebase.
@@ -59,7 +169,7 @@ def create_pr_task(self, job_id: str):
         raise e
 
 
-@celery_app.task(bind=True, name="transformation.validate")
+@celery_app.task(bind=True, name="transformation.validate", **_LONG_TASK_OPTIONS)
 def validation_task(self, job_id: str):
     """
     Celery task to run the test suite of the refactored code.
@@ -76,15 +186,46 @@ def validation_task(self, job_id: str):
     try:
         # For now, we assume a Python project with pytest.
         # A more robust solution would detect the test framework.
-        process = subprocess.run(
-            ["pytest"],
+        # Output is streamed line by line into a bounded buffer so a noisy
+        # test suite can neither exhaust memory nor fill the pipe.
+        command = ["pytest", "-q", "--maxfail=5"]
+        process = subprocess.Popen(
+            command,
             cwd=repo_path,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=300,  # 5-minute timeout for tests
+            bufsize=65536,
+            env={**os.environ, "PYTHONUNBUFFERED": "1"},
+            # Own process group, so the timeout also kills any children the
+            # tests spawn (they inherit stdout and would keep the loop below alive)
+            start_new_session=True,
         )
+        output_tail: deque = deque(maxlen=VALIDATION_OUTPUT_MAX_LINES)
+        timed_out = threading.Event()
+
+        def _kill_on_timeout():
+            timed_out.set()
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
 
-        if process.returncode == 0:
+        timer = threading.Timer(VALIDATION_TIMEOUT_SECONDS, _kill_on_timeout)
+        timer.start()
+        try:
+            for line in process.stdout:
+                output_tail.append(line)
+                log.debug(f"[{job_id}] {line.rstrip()}")
+            returncode = process.wait()
+        finally:
+            timer.cancel()
+            process.stdout.close()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(command, VALIDATION_TIMEOUT_SECONDS)
+
+        if returncode == 0:
             log.info(f"Tests passed for job {job_id}.")
             transformation_orchestrator.update_job_state(
                 job_id, TransformationState.CREATING_PR
@@ -92,10 +233,8 @@ def validation_task(self, job_id: str):
             create_pr_task.delay(job_id)
             log.info(f"Dispatched create_pr_task for job {job_id}.")
         else:
-            log.error(
-                f"Tests failed for job {job_id}. Return code: {process.returncode}"
-            )
-            error_output = f"Stdout:\n{process.stdout}\n\nStderr:\n{process.stderr}"
+            log.error(f"Tests failed for job {job_id}. Return code: {returncode}")
+            error_output = f"Output:\n{''.join(output_tail)}"
             transformation_orchestrator.update_job_state(
                 job_id,
                 TransformationState.ERROR,
@@ -128,7 +267,7 @@ def validation_task(self, job_id: str):
         raise e
 
 
-@celery_app.task(bind=True, name="transformation.clone_and_scan")
+@celery_app.task(bind=True, name="transformation.clone_and_scan", **_LONG_TASK_OPTIONS)
 def clone_and_scan_task(self, job_id: str):
     """
     Celery task to clone a git repository and then scan it.
@@ -144,8 +283,8 @@ def clone_and_scan_task(self, job_id: str):
     log.info(f"Cloning repository {repo_url} into {temp_dir}")
 
     try:
-        # Clone the repository
-        git.Repo.clone_from(repo_url, temp_dir)
+        # Clone the repository via the shared local mirror
+        _clone_from_cache(repo_url, temp_dir)
 
         # Update the job state with the path to the cloned repo
         transformation_orchestrator.update_job_state(
@@ -2,10 +2,32 @@
 This module handles writing to the CHANGELELOG.md file.
 """
 
+import json
+import os
+import re
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Set, Tuple
 
 CHANGELOG_PATH = Path("CHANGELOG.md")
+# Sidecar index of "file::version" keys already present in CHANGELOG.md,
+# so appending does not have to re-read the whole changelog.
+CHANGELOG_INDEX_PATH = CHANGELOG_PATH.with_suffix(".index.json")
+
+_BLOCK_HEADER_RE = re.compile(r"^## \[(?P<version>[^\]]*)\] — .*\n### (?P<file>.*)$", re.M)
+
+# In-process cache of the index: (CHANGELOG.md size, mtime_ns, keys)
+_index_cache: Optional[Tuple[int, int, Set[str]]] = None
+
+
+def _changelog_stat() -> Tuple[int, int]:
+    """
+    Returns (size, mtime_ns) of CHANGELOG.md, or (-1, -1) if it is missing.
+    """
+    try:
+        st = CHANGELOG_PATH.stat()
+    except FileNotFoundError:
+        return (-1, -1)
+    return (st.st_size, st.st_mtime_ns)
 
 
 def format_changelog_block(
@@ -21,23 +43,96 @@ def format_changelog_block(
     return "\n".join(lines)
 
 
-def append_to_changelog(payload: Dict):
+def _index_key(file: str, version: str) -> str:
+    return f"{file}::{version}"
+
+
+def _save_index(keys: Set[str]):
     """
-    Appends a changelog block to the CHANGELOG.md file.
+    Atomically rewrites the changelog index, stamped with the current size
+    and mtime of CHANGELOG.md.
+    """
+    global _index_cache
+    size, mtime_ns = _changelog_stat()
+    tmp_path = CHANGELOG_INDEX_PATH.with_name(CHANGELOG_INDEX_PATH.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump({"size": size, "mtime_ns": mtime_ns, "keys": sorted(keys)}, f)
+    os.replace(tmp_path, CHANGELOG_INDEX_PATH)
+    _index_cache = (size, mtime_ns, keys)
+
+
+def _load_index() -> Set[str]:
+    """
+    Loads the changelog index. It is rebuilt from CHANGELOG.md whenever the
+    changelog's size or mtime no longer match the ones stored in the index
+    (edited, replaced or deleted by hand).
     """
-    file = payload["file"]
-    version = payload["version"]
-    updated = payload.get("updated", "unknown")
-    features = payload.get("features", [])
+    global _index_cache
+    size, mtime_ns = _changelog_stat()
+    if _index_cache is not None and _index_cache[:2] == (size, mtime_ns):
+        return _index_cache[2]
 
-    block = format_changelog_block(file, version, updated, features)
+    try:
+        with CHANGELOG_INDEX_PATH.open("r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index["size"] == size and index["mtime_ns"] == mtime_ns:
+            keys = set(index["keys"])
+            _index_cache = (size, mtime_ns, keys)
+            return keys
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
 
-    if CHANGELOG_PATH.exists():
+    keys = set()
+    if size >= 0:
         existing = CHANGELOG_PATH.read_text(encoding="utf-8")
-        if block in existing:
+        for match in _BLOCK_HEADER_RE.finditer(existing):
+            keys.add(_index_key(match.group("file"), match.group("version")))
+    _save_index(keys)
+    return keys
+
+
+def append_many(payloads: List[Dict]):
+    """
+    Appends several changelog blocks to the CHANGELOG.md file with a single
+    write and fsync.
+    """
+    keys = _load_index()
+    new_keys: Set[str] = set()
+    blocks = []
+
+    for payload in payloads:
+        file = payload["file"]
+        version = payload["version"]
+        key = _index_key(file, version)
+        if key in keys or key in new_keys:
             print(f"[ℹ️] Entry already exists in CHANGELOG.md for: {file} {version}")
-            return
+            continue
+
+        updated = payload.get("updated", "unknown")
+        features = payload.get("features", [])
+        blocks.append(format_changelog_block(file, version, updated, features))
+        new_keys.add(key)
+
+    if not blocks:
+        return
 
-    with CHANGELOG_PATH.open("a", encoding="utf-8") as f:
-        f.write("\n" + block)
-        print("[📝] Appended to CHANGELOG.md")
+    data = "".join("\n" + block for block in blocks).encode("utf-8")
+    fd = os.open(CHANGELOG_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    print(f"[📝] Appended {len(blocks)} entries to CHANGELOG.md")
+
+    _save_index(keys | new_keys)
+
+
+def append_to_changelog(payload: Dict):
+    """
+    Appends a changelog block to the CHANGELOG.md file.
+    """
+    append_many([payload])
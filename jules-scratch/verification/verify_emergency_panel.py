@@ -1,26 +1,36 @@
+import asyncio
 import os
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
 
-def run(playwright):
-    browser = playwright.chromium.launch()
-    page = browser.new_page()
+# Pages to verify: (local HTML file, screenshot path)
+PAGES = [
+    ('/app/emergency-panel-app/index.html', 'jules-scratch/verification/emergency-panel.png'),
+    ('/app/emergency-panel-app/index_enhanced.html', 'jules-scratch/verification/emergency-panel-enhanced.png'),
+]
 
-    # Construct the full file path
-    file_path = '/app/emergency-panel-app/index.html'
+async def run(playwright):
+    # Launch the browser once and reuse a single context for every page
+    browser = await playwright.chromium.launch()
+    context = await browser.new_context()
+    page = await context.new_page()
 
-    # Navigate to the local HTML file
-    page.goto(f'file://{file_path}')
+    for file_path, screenshot_path in PAGES:
+        # Navigate to the local HTML file
+        await page.goto(f'file://{file_path}')
 
-    # Wait for the page to load
-    page.wait_for_selector('h1')
+        # Wait for the page to load
+        await page.wait_for_load_state('domcontentloaded')
 
-    # Take a screenshot
-    screenshot_path = 'jules-scratch/verification/emergency-panel.png'
-    page.screenshot(path=screenshot_path)
+        # Take a screenshot
+        await page.screenshot(path=screenshot_path)
 
-    print(f"Screenshot saved to {screenshot_path}")
+        print(f"Screenshot saved to {screenshot_path}")
 
-    browser.close()
+    await context.close()
+    await browser.close()
 
-with sync_playwright() as playwright:
-    run(playwright)
+async def main():
+    async with async_playwright() as playwright:
+        await run(playwright)
+
+asyncio.run(main())
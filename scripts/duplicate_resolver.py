@@ -11,11 +11,185 @@ Bu script duplicate files va code'larni aniqlaydi va hal qiladi:
 
 import os
 import json
+import stat
 import hashlib
 import difflib
+import itertools
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Set, Tuple, Optional
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+try:
+    import xxhash  # type: ignore
+    xxhash_available = True
+except ImportError:
+    xxhash_available = False
+try:
+    from blake3 import blake3  # type: ignore
+    blake3_available = True
+except ImportError:
+    blake3_available = False
+try:
+    import orjson  # type: ignore
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+try:
+    import numpy as np  # type: ignore
+    from numba import njit  # type: ignore
+    numba_available = True
+except ImportError:
+    numba_available = False
+
+# Hash'lash uchun chunk hajmi (1 MiB) - katta file'lar RSS'ni oshirmasligi uchun
+HASH_CHUNK_SIZE = 1 << 20
+# Katta collision guruhlari uchun avval faqat boshidagi 4 KiB hash qilinadi
+HEAD_HASH_SIZE = 4096
+
+# Walk paytida butunlay tashlab ketiladigan katalog va file nomlari
+SKIP_DIRS = frozenset({
+    '.vscode', 'node_modules', '.git', '__pycache__',
+    '.next', 'dist', 'build', '.pytest_cache'
+})
+SKIP_FILES = frozenset({'bun.lock', 'package-lock.json'})
+
+TEXT_EXT = frozenset({
+    '.py', '.js', '.ts', '.tsx', '.json', '.md',
+    '.txt', '.yml', '.yaml', '.toml', '.ini', '.cfg',
+    '.html', '.css', '.scss', '.sql'
+})
+CODE_EXT = frozenset({'.py', '.js', '.ts', '.tsx'})
+# Binary file'ni aniqlash uchun o'qiladigan bosh qism (NUL byte bor-yo'qligi)
+TEXT_SNIFF_SIZE = 4096
+
+SIMILARITY_THRESHOLD = 0.8  # 80% similar
+# Process pool'ga bir martada yuboriladigan juftlar soni (xotirani cheklash uchun)
+SIMILARITY_BATCH_SIZE = 10000
+
+# Topilmalar shu NDJSON file'ga darhol yoziladi; xotirada faqat counter'lar
+# va summary uchun bir nechta namunalar qoladi
+FINDINGS_REPORT_NAME = 'DUPLICATE_RESOLUTION_REPORT.jsonl'
+REPORT_PREVIEW_LIMIT = 10
+
+# Code block rolling hash parametrlari (mod 2**64 polinom hash)
+BLOCK_HASH_BASE = 1000003
+MASK64 = (1 << 64) - 1
+
+
+def _dump_record(record: Dict) -> bytes:
+    """Bitta NDJSON qator (orjson mavjud bo'lsa u orqali)"""
+    if orjson_available:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+
+
+def _new_hasher():
+    """Dedup uchun eng tez non-cryptographic hasher: xxh3_128 > BLAKE3 > BLAKE2b"""
+    if xxhash_available:
+        return xxhash.xxh3_128()
+    if blake3_available:
+        return blake3()
+    return hashlib.blake2b()
+
+
+def _hash_file(path: Path) -> Tuple[Path, Optional[str], int]:
+    """File'ni chunk'lab stream hash qilish (process pool uchun top-level)"""
+    try:
+        hasher = _new_hasher()
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            while chunk := f.read(HASH_CHUNK_SIZE):
+                hasher.update(chunk)
+        return path, hasher.hexdigest(), size
+    except OSError:
+        return path, None, 0
+
+
+def _window_hashes_py(line_hashes: List[int], nonempty: List[bool], k: int) -> Tuple[List[int], List[int]]:
+    """Har bir k qatorlik window uchun bo'sh bo'lmagan qatorlar hash'i va soni.
+
+    Prefix polinom hash'dan foydalaniladi, shuning uchun har bir window O(1)."""
+    n = len(line_hashes)
+    prefix = [0] * (n + 1)
+    count = [0] * (n + 1)
+    for j in range(n):
+        if nonempty[j]:
+            prefix[j + 1] = (prefix[j] * BLOCK_HASH_BASE + line_hashes[j]) & MASK64
+            count[j + 1] = count[j] + 1
+        else:
+            prefix[j + 1] = prefix[j]
+            count[j + 1] = count[j]
+    
+    powers = [1] * (k + 1)
+    for j in range(k):
+        powers[j + 1] = (powers[j] * BLOCK_HASH_BASE) & MASK64
+    
+    hashes = []
+    counts = []
+    for i in range(max(n - k, 0)):
+        c = count[i + k] - count[i]
+        hashes.append((prefix[i + k] - prefix[i] * powers[c]) & MASK64)
+        counts.append(c)
+    return hashes, counts
+
+
+if numba_available:
+    @njit(cache=True)
+    def _window_hashes_nb(line_hashes, nonempty, k, base):
+        """_window_hashes_py'ning Numba versiyasi - uint64 arifmetika o'zi wrap qiladi"""
+        n = len(line_hashes)
+        prefix = np.zeros(n + 1, np.uint64)
+        count = np.zeros(n + 1, np.int64)
+        for j in range(n):
+            if nonempty[j]:
+                prefix[j + 1] = prefix[j] * base + line_hashes[j]
+                count[j + 1] = count[j] + 1
+            else:
+                prefix[j + 1] = prefix[j]
+                count[j + 1] = count[j]
+        
+        powers = np.ones(k + 1, np.uint64)
+        for j in range(k):
+            powers[j + 1] = powers[j] * base
+        
+        m = max(n - k, 0)
+        hashes = np.empty(m, np.uint64)
+        counts = np.empty(m, np.int64)
+        for i in range(m):
+            c = count[i + k] - count[i]
+            hashes[i] = prefix[i + k] - prefix[i] * powers[c]
+            counts[i] = c
+        return hashes, counts
+
+
+# Worker process'dagi file content'lari - har bir juft bilan pickle qilinmasligi uchun
+_similarity_contents: List[str] = []
+
+
+def _init_similarity_worker(contents: List[str]) -> None:
+    """Process pool initializer: content'larni worker'ga bir marta uzatish"""
+    global _similarity_contents
+    _similarity_contents = contents
+
+
+def _ratio_pair(pair: Tuple[int, int]) -> float:
+    """Ikki file (index bo'yicha) SequenceMatcher ratio'si - picklable top-level"""
+    i, j = pair
+    return difflib.SequenceMatcher(None, _similarity_contents[i], _similarity_contents[j]).ratio()
+
+
+def _hash_file_head(path: Path) -> Tuple[Path, Optional[str], int]:
+    """Faqat file boshini (HEAD_HASH_SIZE) hash qilish - arzon pre-filter"""
+    try:
+        hasher = _new_hasher()
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            hasher.update(f.read(HEAD_HASH_SIZE))
+        return path, hasher.hexdigest(), size
+    except OSError:
+        return path, None, 0
+
 
 class DuplicateResolver:
     def __init__(self, project_root: str):
@@ -27,22 +201,37 @@ class DuplicateResolver:
         }
         self.resolved = []
         self.skipped = []
+        self.counts = defaultdict(int)
+        self.space_saved = 0
+        self._findings_file = None
+        # (path, size, is_text, is_code) - bitta walk natijasi, barcha phase'lar uchun
+        self._all_files: Optional[List[Tuple[Path, int, bool, bool]]] = None
     
     def resolve_duplicates(self):
         """Duplicate'larni aniqlash va hal qilish"""
         print("🔍 Duplicate files'ni qidiraman...")
         
-        # Exact file duplicates
-        self._find_exact_duplicates()
-        
-        # Similar content files
-        self._find_similar_files()
-        
-        # Code block duplicates
-        self._find_duplicate_code_blocks()
-        
-        # Duplicate'larni resolve qilish
-        self._resolve_exact_duplicates()
+        # NDJSON report har run'da boshidan yoziladi - topilma bo'lmasa ham
+        # oldingi run natijalari qolib ketmaydi; xato bo'lsa ham file yopiladi
+        self._findings_file = open(self.project_root / FINDINGS_REPORT_NAME, 'wb')
+        try:
+            # File'larni bir marta yig'ish
+            self._collect_files()
+            
+            # Exact file duplicates
+            self._find_exact_duplicates()
+            
+            # Similar content files
+            self._find_similar_files()
+            
+            # Code block duplicates
+            self._find_duplicate_code_blocks()
+            
+            # Duplicate'larni resolve qilish
+            self._resolve_exact_duplicates()
+        finally:
+            self._findings_file.close()
+            self._findings_file = None
         
         self._generate_report()
     
@@ -52,23 +241,44 @@ class DuplicateResolver:
         
         file_hashes = defaultdict(list)
         
-        # Barcha file'larni hash qilish
-        for file_path in self.project_root.rglob("*"):
-            if file_path.is_file() and self._should_process_file(file_path):
-                try:
-                    with open(file_path, 'rb') as f:
-                        file_hash = hashlib.md5(f.read()).hexdigest()
-                        file_hashes[file_hash].append(file_path)
-                except Exception as e:
-                    continue
+        # 1-pass: file'larni hajmi bo'yicha guruhlash - unique hajmli
+        # file'lar duplicate bo'la olmaydi, ular umuman o'qilmaydi
+        sizes = defaultdict(list)
+        for file_path, size, _, _ in self._collect_files():
+            sizes[size].append(file_path)
+        
+        small_files = []
+        large_files = []
+        for size, paths in sizes.items():
+            if len(paths) > 1:
+                (large_files if size > HEAD_HASH_SIZE else small_files).extend(paths)
+        
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            # 2-pass: katta file'larni avval boshidagi 4 KiB bo'yicha ajratish
+            head_groups = defaultdict(list)
+            for file_path, head_hash, size in pool.map(_hash_file_head, large_files, chunksize=64):
+                if head_hash is not None:
+                    head_groups[(size, head_hash)].append(file_path)
+            
+            files_to_hash = small_files + [
+                file_path
+                for paths in head_groups.values() if len(paths) > 1
+                for file_path in paths
+            ]
+            
+            # 3-pass: qolgan nomzodlarni to'liq parallel hash qilish
+            for file_path, file_hash, size in pool.map(_hash_file, files_to_hash, chunksize=64):
+                if file_hash is not None:
+                    file_hashes[file_hash].append((file_path, size))
         
         # Duplicate'larni saqlash
-        for file_hash, files in file_hashes.items():
-            if len(files) > 1:
-                self.duplicates['exact_files'].append({
+        for file_hash, entries in file_hashes.items():
+            if len(entries) > 1:
+                files = [file_path for file_path, _ in entries]
+                self._record_finding('exact_files', {
                     'hash': file_hash,
                     'files': [str(f) for f in files],
-                    'size': files[0].stat().st_size if files[0].exists() else 0
+                    'size': entries[0][1]
                 })
                 print(f"  🔴 Found {len(files)} exact duplicates: {files[0].name}")
     
@@ -79,33 +289,55 @@ class DuplicateResolver:
         text_files = []
         
         # Text file'larni yig'ish
-        for file_path in self.project_root.rglob("*"):
-            if (file_path.is_file() and 
-                self._should_process_file(file_path) and
-                self._is_text_file(file_path)):
-                
+        for file_path, size, is_text, _ in self._collect_files():
+            # Minimum content - 100 byte'dan kichik file'ni ochish shart emas
+            if is_text and size > 100:
                 try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
+                    with open(file_path, 'rb') as f:
+                        # Magic-byte check: NUL byte bo'lsa binary, qolganini o'qimaymiz
+                        head = f.read(TEXT_SNIFF_SIZE)
+                        if b"\0" in head:
+                            continue
+                        content = (head + f.read()).decode('utf-8', errors='ignore')
                         if len(content) > 100:  # Minimum content
                             text_files.append((file_path, content))
                 except Exception:
                     continue
         
-        # Similarity check
-        for i, (file1, content1) in enumerate(text_files):
-            for j, (file2, content2) in enumerate(text_files[i+1:], i+1):
-                similarity = self._calculate_similarity(content1, content2)
-                
-                if similarity > 0.8:  # 80% similar
-                    self.duplicates['similar_files'].append({
-                        'file1': str(file1),
-                        'file2': str(file2),
-                        'similarity': similarity,
-                        'size1': len(content1),
-                        'size2': len(content2)
-                    })
-                    print(f"  🟡 Similar files ({similarity:.1%}): {file1.name} ↔ {file2.name}")
+        # Candidate juftlar: ratio = 2*M/(len1+len2) <= 2*min/(len1+len2),
+        # shuning uchun uzunlik bo'yicha sort qilib, bu chegara threshold'dan
+        # oshmaydigan juftlarni umuman taqqoslamaymiz
+        text_files.sort(key=lambda item: len(item[1]))
+        contents = [content for _, content in text_files]
+        
+        def candidate_pairs():
+            for i, content1 in enumerate(contents):
+                len1 = len(content1)
+                for j in range(i + 1, len(contents)):
+                    if 2 * len1 / (len1 + len(contents[j])) <= SIMILARITY_THRESHOLD:
+                        break
+                    yield i, j
+        
+        # Similarity check - SequenceMatcher CPU-bound, shuning uchun process'lar
+        pairs = candidate_pairs()
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_similarity_worker,
+            initargs=(contents,)
+        ) as pool:
+            while batch := list(islice(pairs, SIMILARITY_BATCH_SIZE)):
+                for (i, j), similarity in zip(batch, pool.map(_ratio_pair, batch, chunksize=32)):
+                    if similarity > SIMILARITY_THRESHOLD:
+                        file1, content1 = text_files[i]
+                        file2, content2 = text_files[j]
+                        self._record_finding('similar_files', {
+                            'file1': str(file1),
+                            'file2': str(file2),
+                            'similarity': similarity,
+                            'size1': len(content1),
+                            'size2': len(content2)
+                        })
+                        print(f"  🟡 Similar files ({similarity:.1%}): {file1.name} ↔ {file2.name}")
     
     def _find_duplicate_code_blocks(self):
         """Duplicate code block'larni topish"""
@@ -114,11 +346,8 @@ class DuplicateResolver:
         code_files = []
         
         # Code file'larni yig'ish  
-        for file_path in self.project_root.rglob("*"):
-            if (file_path.is_file() and 
-                file_path.suffix in ['.py', '.js', '.ts', '.tsx'] and
-                self._should_process_file(file_path)):
-                
+        for file_path, _, _, is_code in self._collect_files():
+            if is_code:
                 try:
                     with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                         lines = f.readlines()
@@ -126,20 +355,44 @@ class DuplicateResolver:
                 except Exception:
                     continue
         
-        # Block duplicate'larni qidirish
-        for file1, lines1 in code_files:
-            for file2, lines2 in code_files:
-                if file1 >= file2:  # Avoid duplicates
-                    continue
-                    
-                duplicates = self._find_duplicate_blocks(lines1, lines2)
-                
-                if duplicates:
-                    self.duplicates['code_blocks'].append({
-                        'file1': str(file1),
-                        'file2': str(file2),
-                        'blocks': duplicates
+        # Block index: har bir window hash'i -> [(file index, start line)]
+        # Juftma-juft taqqoslash o'rniga bitta pass - O(F·L)
+        code_files.sort(key=lambda item: item[0])
+        block_index = defaultdict(list)
+        for file_idx, (_, lines) in enumerate(code_files):
+            for start, block_hash in self._find_duplicate_blocks(lines):
+                block_index[block_hash].append((file_idx, start))
+        
+        # Bir nechta file'da uchragan bucket'lar - duplicate block'lar
+        pair_blocks = defaultdict(list)
+        min_lines = 5
+        # Bucket'lar file index bo'yicha tartiblangan, shuning uchun har doim idx1 < idx2
+        for entries in block_index.values():
+            if len(entries) < 2:
+                continue
+            for a, (idx1, start1) in enumerate(entries):
+                block1 = self._clean_block(code_files[idx1][1], start1, min_lines)
+                for idx2, start2 in entries[a+1:]:
+                    if idx1 == idx2:
+                        continue
+                    # 64-bit hash collision'dan himoya - haqiqiy tekshiruv
+                    if self._clean_block(code_files[idx2][1], start2, min_lines) != block1:
+                        continue
+                    pair_blocks[(idx1, idx2)].append({
+                        'start1': start1 + 1,
+                        'end1': start1 + min_lines,
+                        'start2': start2 + 1,
+                        'end2': start2 + min_lines,
+                        'lines': min_lines
                     })
+        
+        for (idx1, idx2), blocks in sorted(pair_blocks.items()):
+            blocks.sort(key=lambda b: (b['start1'], b['start2']))
+            self._record_finding('code_blocks', {
+                'file1': str(code_files[idx1][0]),
+                'file2': str(code_files[idx2][0]),
+                'blocks': blocks
+            })
     
     def _resolve_exact_duplicates(self):
         """Exact duplicate'larni hal qilish"""
@@ -148,79 +401,146 @@ class DuplicateResolver:
         for dup_group in self.duplicates['exact_files']:
             files = [Path(f) for f in dup_group['files']]
             
-            # Eng yaxshi file'ni tanlash (path bo'yicha)
-            primary_file = min(files, key=lambda f: (len(f.parts), str(f)))
-            duplicate_files = [f for f in files if f != primary_file]
+            # Eng yaxshi file'ni tanlash (path bo'yicha) - bir marta sort
+            files.sort(key=lambda f: (len(f.parts), f.as_posix()))
+            primary_file, *duplicate_files = files
             
             print(f"  📌 Primary: {primary_file}")
             
-            # Duplicate'larni o'chirish
+            # Duplicate'larni primary'ga hardlink bilan almashtirish -
+            # joy tejaladi, lekin eski path'lar ishlashda davom etadi
             for dup_file in duplicate_files:
                 try:
-                    if dup_file.exists():
-                        dup_file.unlink()
-                        self.resolved.append({
-                            'action': 'deleted_duplicate',
-                            'file': str(dup_file),
-                            'primary': str(primary_file),
-                            'size_saved': dup_group['size']
-                        })
-                        print(f"    ✅ Deleted: {dup_file}")
+                    space_saved = self._hardlink_duplicate(dup_file, primary_file)
+                    if space_saved is None:
+                        continue
+                    self._record_finding('resolved', {
+                        'action': 'hardlinked_duplicate',
+                        'file': str(dup_file),
+                        'primary': str(primary_file),
+                        'size_saved': space_saved
+                    })
+                    print(f"    🔗 Hardlinked: {dup_file}")
+                except FileNotFoundError:
+                    continue
                 except Exception as e:
-                    self.skipped.append({
+                    self._record_finding('skipped', {
                         'file': str(dup_file),
                         'reason': str(e)
                     })
-                    print(f"    ❌ Failed to delete: {dup_file}")
+                    print(f"    ❌ Failed to hardlink: {dup_file}")
     
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """Matn similarity'ni hisoblash"""
-        return difflib.SequenceMatcher(None, text1, text2).ratio()
+    def _hardlink_duplicate(self, dup_file: Path, primary_file: Path) -> Optional[int]:
+        """Duplicate'ni primary'ga hardlink qilish, tejalgan byte'larni qaytarish.
+
+        Crash-safe: link avval unikal vaqtinchalik nom bilan yaratiladi
+        (os.link mavjud file'ni hech qachon ustiga yozmaydi), keyin
+        os.replace bilan duplicate o'rniga atomik qo'yiladi. Allaqachon link
+        bo'lsa None.
+
+        Eslatma: link'dan keyin barcha path'lar bitta inode'ni bo'lishadi -
+        bittasini joyida tahrirlash qolganlarini ham o'zgartiradi. Shu sabab
+        permission yoki owner'i farq qiladigan file'lar link qilinmaydi."""
+        dup_st = dup_file.stat()
+        primary_st = primary_file.stat()
+        if (dup_st.st_dev, dup_st.st_ino) == (primary_st.st_dev, primary_st.st_ino):
+            return None
+        if (dup_st.st_mode, dup_st.st_uid, dup_st.st_gid) != (
+            primary_st.st_mode, primary_st.st_uid, primary_st.st_gid
+        ):
+            raise ValueError("mode/owner primary'dan farq qiladi")
+        
+        for attempt in itertools.count():
+            tmp_file = dup_file.with_name(f".{dup_file.name}.{os.getpid()}.{attempt}.dupnew")
+            try:
+                os.link(primary_file, tmp_file)
+                break
+            except FileExistsError:
+                continue
+        try:
+            os.replace(tmp_file, dup_file)
+        except OSError:
+            tmp_file.unlink()
+            raise
+        
+        # Boshqa link'lari bo'lmasa, inode bloklari bo'shaydi
+        return dup_st.st_blocks * 512 if dup_st.st_nlink == 1 else 0
     
-    def _find_duplicate_blocks(self, lines1: List[str], lines2: List[str], min_lines: int = 5) -> List[Dict]:
-        """Code block duplicate'larni topish"""
-        duplicates = []
-        
-        for i in range(len(lines1) - min_lines):
-            for j in range(len(lines2) - min_lines):
-                # Block'ni taqqoslash
-                block1 = lines1[i:i+min_lines]
-                block2 = lines2[j:j+min_lines]
-                
-                # Clean comparison (whitespace ignore)
-                clean1 = [line.strip() for line in block1 if line.strip()]
-                clean2 = [line.strip() for line in block2 if line.strip()]
-                
-                if len(clean1) >= 3 and clean1 == clean2:
-                    duplicates.append({
-                        'start1': i + 1,
-                        'end1': i + min_lines,
-                        'start2': j + 1, 
-                        'end2': j + min_lines,
-                        'lines': min_lines
-                    })
+    def _record_finding(self, kind: str, record: Dict):
+        """Topilmani NDJSON report'ga darhol yozish va counter'ni oshirish.
+
+        Exact duplicate'lar (resolve uchun kerak), resolved va skipped to'liq
+        saqlanadi; similar/code block'lardan faqat summary namunalari."""
+        self._findings_file.write(_dump_record({'type': kind, **record}))
+        self.counts[kind] += 1
         
-        return duplicates
+        if kind == 'resolved':
+            self.resolved.append(record)
+            self.space_saved += record.get('size_saved', 0)
+        elif kind == 'skipped':
+            self.skipped.append(record)
+        elif kind == 'exact_files' or len(self.duplicates[kind]) < REPORT_PREVIEW_LIMIT:
+            self.duplicates[kind].append(record)
     
-    def _should_process_file(self, file_path: Path) -> bool:
-        """File process qilinishi kerakmi?"""
-        skip_patterns = [
-            '.vscode', 'node_modules', '.git', '__pycache__',
-            '.next', 'dist', 'build', '.pytest_cache',
-            'bun.lock', 'package-lock.json'
-        ]
+    def _find_duplicate_blocks(self, lines: List[str], min_lines: int = 5) -> List[Tuple[int, int]]:
+        """Har bir min_lines'lik window uchun (start, rolling hash) qaytarish"""
+        # Clean comparison (whitespace ignore)
+        clean = [line.strip() for line in lines]
         
-        str_path = str(file_path)
-        return not any(pattern in str_path for pattern in skip_patterns)
+        if numba_available:
+            line_hashes = np.fromiter((hash(line) & MASK64 for line in clean), dtype=np.uint64, count=len(clean))
+            nonempty = np.fromiter((bool(line) for line in clean), dtype=np.bool_, count=len(clean))
+            hashes, counts = _window_hashes_nb(line_hashes, nonempty, min_lines, np.uint64(BLOCK_HASH_BASE))
+            hashes, counts = hashes.tolist(), counts.tolist()
+        else:
+            line_hashes = [hash(line) & MASK64 for line in clean]
+            nonempty = [bool(line) for line in clean]
+            hashes, counts = _window_hashes_py(line_hashes, nonempty, min_lines)
+        
+        return [
+            (i, block_hash)
+            for i, (block_hash, c) in enumerate(zip(hashes, counts))
+            if c >= 3
+        ]
+    
+    def _clean_block(self, lines: List[str], start: int, min_lines: int = 5) -> List[str]:
+        """Window'dagi bo'sh bo'lmagan, strip qilingan qatorlar"""
+        return [line for line in (raw.strip() for raw in lines[start:start+min_lines]) if line]
+    
+    def _collect_files(self) -> List[Tuple[Path, int, bool, bool]]:
+        """Process qilinadigan file'lar: (path, size, is_text, is_code) - bir marta walk, keyin cache"""
+        if self._all_files is None:
+            files = []
+            for root, dirs, names in os.walk(self.project_root):
+                # Skip qilinadigan katalog'larga umuman kirmaslik
+                dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+                for name in names:
+                    # Report file'ining o'zi (hozir yozilayotgan) tahlil qilinmaydi
+                    if name in SKIP_FILES or name == FINDINGS_REPORT_NAME:
+                        continue
+                    file_path = Path(root) / name
+                    try:
+                        st = file_path.stat()
+                    except OSError:
+                        continue
+                    if not stat.S_ISREG(st.st_mode):
+                        continue
+                    suffix = file_path.suffix
+                    files.append((
+                        file_path,
+                        st.st_size,
+                        self._is_text_file(file_path),
+                        suffix in CODE_EXT
+                    ))
+            self._all_files = files
+        return self._all_files
     
     def _is_text_file(self, file_path: Path) -> bool:
-        """Text file ekanmi?"""
-        text_extensions = {
-            '.py', '.js', '.ts', '.tsx', '.json', '.md', 
-            '.txt', '.yml', '.yaml', '.toml', '.ini', '.cfg',
-            '.html', '.css', '.scss', '.sql'
-        }
-        return file_path.suffix.lower() in text_extensions
+        """Text file bo'lishi mumkinmi? (Dockerfile, Makefile kabi extension'siz file'lar ham)
+
+        Yakuniy qaror file boshidagi NUL byte tekshiruvi bilan qilinadi."""
+        suffix = file_path.suffix.lower()
+        return suffix in TEXT_EXT or not suffix
     
     def _generate_report(self):
         """Report yaratish"""
@@ -229,13 +549,13 @@ class DuplicateResolver:
         print("=" * 60)
         
         # Statistics
-        total_exact = len(self.duplicates['exact_files'])
-        total_similar = len(self.duplicates['similar_files'])
-        total_code_blocks = len(self.duplicates['code_blocks'])
-        total_resolved = len(self.resolved)
+        total_exact = self.counts['exact_files']
+        total_similar = self.counts['similar_files']
+        total_code_blocks = self.counts['code_blocks']
+        total_resolved = self.counts['resolved']
         
         # Space saved
-        space_saved = sum(r.get('size_saved', 0) for r in self.resolved)
+        space_saved = self.space_saved
         
         print(f"📋 Exact file duplicates: {total_exact}")
         print(f"📊 Similar files: {total_similar}")
@@ -258,9 +578,10 @@ class DuplicateResolver:
                 print(f"  {Path(block['file1']).name} ↔ {Path(block['file2']).name}")
                 print(f"    {len(block['blocks'])} duplicate blocks found")
         
-        # Report'ni saqlash
+        # Summary report - to'liq topilmalar NDJSON file'da
         report = {
-            'duplicates_found': self.duplicates,
+            'findings_file': FINDINGS_REPORT_NAME,
+            'duplicates_preview': self.duplicates,
             'resolved_items': self.resolved,
             'skipped_items': self.skipped,
             'statistics': {
@@ -275,7 +596,8 @@ class DuplicateResolver:
         with open(self.project_root / 'DUPLICATE_RESOLUTION_REPORT.json', 'w') as f:
             json.dump(report, f, indent=2, ensure_ascii=False)
         
-        print(f"\n📄 Full report: DUPLICATE_RESOLUTION_REPORT.json")
+        print(f"\n📄 Summary report: DUPLICATE_RESOLUTION_REPORT.json")
+        print(f"📄 All findings: {FINDINGS_REPORT_NAME}")
         print("=" * 60)
 
 def main():
@@ -5,17 +5,94 @@ Fast Duplicate Resolver - Optimized for ZeroDev AI Project
 Quick detection and resolution of duplicate files with safety checks.
 """
 
+import argparse
+from array import array
 import hashlib
+import mmap
 import os
 import json
+import sqlite3
 from pathlib import Path
-from collections import defaultdict
-from typing import Dict, List, Set, Tuple
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 import shutil
+import sys
+try:
+    import xxhash  # type: ignore
+    xxhash_available = True
+except ImportError:
+    xxhash_available = False
+try:
+    from blake3 import blake3  # type: ignore
+    blake3_available = True
+except ImportError:
+    blake3_available = False
+try:
+    import orjson  # type: ignore
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+try:
+    import pathspec  # type: ignore
+    pathspec_available = True
+except ImportError:
+    pathspec_available = False
+
+# Files larger than this are memory-mapped and hashed in one update() call
+MMAP_THRESHOLD = 1024 * 1024
+# Files up to this size are read and hashed in a single update() call and
+# dispatched to the thread pool in batches rather than one task per file
+SMALL_FILE_SIZE = 64 * 1024
+SMALL_FILE_BATCH = 16
+# Larger candidates are first sub-bucketed by a cheap hash of this many
+# leading bytes; only files whose prefixes also collide get the full hash
+PREFIX_HASH_SIZE = 64 * 1024
+# Persistent digest cache, keyed by path and validated by size + mtime_ns,
+# so unchanged files are not re-hashed on later runs
+HASH_CACHE_NAME = '.duplicate_cache.sqlite'
+# Duplicates spread across these directories always need manual review
+IMPORTANT_DIRS = frozenset({'src', 'backend', 'frontend', 'api', 'components'})
+# Per-group analysis records, streamed one JSON object per line
+GROUPS_REPORT_NAME = 'DUPLICATE_ANALYSIS_REPORT.ndjson'
+# Manual-review groups echoed to the console after the run
+MANUAL_REVIEW_PREVIEW = 5
+# Removal log lines buffered before each write to stdout
+LOG_FLUSH_LINES = 1000
+
+
+def _dump_record(record: Dict) -> bytes:
+    """Encode one NDJSON line (via orjson when available)"""
+    if orjson_available:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record) + "\n").encode('utf-8')
+
+
+def _select_hash_backend(secure: bool) -> Tuple[str, Callable]:
+    """Pick the fastest available digest as (algorithm name, hasher factory)
+
+    xxhash, blake3 and OpenSSL's SHA-256 each dispatch to the best SIMD/SHA
+    extension of the running CPU internally, so only availability matters here.
+    """
+    if secure:
+        return 'sha256', hashlib.sha256
+    if xxhash_available:
+        return 'xxh3_128', xxhash.xxh3_128
+    if blake3_available:
+        return 'blake3', lambda: blake3(max_threads=blake3.AUTO)
+    return 'sha256', hashlib.sha256
+
 
 class FastDuplicateResolver:
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, secure: bool = False):
         self.project_root = Path(project_root)
+        # SHA-256 only when a cryptographic digest is explicitly requested;
+        # plain content-equality bucketing uses a much faster hash
+        self.secure = secure
+        # Hash backend is resolved once here instead of on every file
+        self._hash_algo, self._hash_fn = _select_hash_backend(secure)
         self.duplicates: Dict[str, List[Path]] = defaultdict(list)
         self.resolved_count = 0
         self.saved_space = 0
@@ -33,7 +110,8 @@ class FastDuplicateResolver:
         }
         
         # Safe to remove patterns
-        self.safe_remove_patterns = {
+        # (matched against path components and the file suffix)
+        self.safe_remove_patterns = frozenset({
             '__pycache__',
             '.pyc',
             '.pyo', 
@@ -42,35 +120,139 @@ class FastDuplicateResolver:
             '.coverage',
             'node_modules',
             '.pytest_cache'
-        }
+        })
 
-    def get_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA-256 hash of file content"""
+    def get_file_hash(self, file_path: Path, file_size: Optional[int] = None) -> str:
+        """Calculate content hash of file (xxh3_128/BLAKE3, or SHA-256 in secure mode)"""
         try:
-            hasher = hashlib.sha256()
+            hasher = self._hash_fn()
             with open(file_path, 'rb') as f:
-                # Read in chunks for large files
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hasher.update(chunk)
+                if file_size is None:
+                    file_size = os.fstat(f.fileno()).st_size
+                if file_size > MMAP_THRESHOLD:
+                    # Large files: hand the whole mapping to the C hasher at once,
+                    # no per-chunk Python calls or copies (pages load on demand)
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        hasher.update(mm)
+                else:
+                    # Small files: one read, one update
+                    hasher.update(f.read())
             return hasher.hexdigest()
-        except (IOError, OSError):
+        except (IOError, OSError, ValueError):
             return ""
 
+    def _load_hash_cache(self) -> Dict[str, Tuple[int, int, str]]:
+        """Load cached {path: (size, mtime_ns, digest)} for the current algorithm"""
+        cache_path = self.project_root / HASH_CACHE_NAME
+        if not cache_path.exists():
+            return {}
+        try:
+            with sqlite3.connect(cache_path) as conn:
+                rows = conn.execute(
+                    "SELECT path, size, mtime, digest FROM h WHERE algo = ?",
+                    (self._hash_algo,)
+                ).fetchall()
+        except sqlite3.Error:
+            return {}
+        return {path: (size, mtime, digest) for path, size, mtime, digest in rows}
+
+    def _save_hash_cache(self, entries: List[Tuple[str, int, int, str]], seen_paths: List[str]) -> None:
+        """Store newly computed (path, size, mtime_ns, digest) rows and drop rows
+        for paths not seen in this walk, in one transaction"""
+        cache_path = self.project_root / HASH_CACHE_NAME
+        if not entries and not cache_path.exists():
+            return
+        algo = self._hash_algo
+        try:
+            conn = sqlite3.connect(cache_path)
+            try:
+                with conn:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS h ("
+                        "path TEXT PRIMARY KEY, size INT, mtime INT, algo TEXT, digest TEXT)"
+                    )
+                    conn.execute("CREATE TEMP TABLE seen (path TEXT PRIMARY KEY)")
+                    conn.executemany("INSERT OR IGNORE INTO seen VALUES (?)", ((path,) for path in seen_paths))
+                    conn.execute("DELETE FROM h WHERE path NOT IN (SELECT path FROM seen)")
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO h VALUES (?, ?, ?, ?, ?)",
+                        [(path, size, mtime, algo, digest) for path, size, mtime, digest in entries]
+                    )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"   ⚠️  Could not update hash cache: {e}")
+
+    def get_prefix_hash(self, file_path: Path) -> Optional[int]:
+        """Cheap 64-bit hash of the first PREFIX_HASH_SIZE bytes (None on error)"""
+        try:
+            with open(file_path, 'rb') as f:
+                head = f.read(PREFIX_HASH_SIZE)
+        except (IOError, OSError):
+            return None
+        if xxhash_available:
+            return xxhash.xxh3_64_intdigest(head)
+        return int.from_bytes(hashlib.blake2b(head, digest_size=8).digest(), 'little')
+
+    def _hash_batch(self, batch: List[Tuple[str, int]]) -> List[str]:
+        """Hash a batch of (path, size) pairs within a single pool task"""
+        return [self.get_file_hash(file_path, file_size) for file_path, file_size in batch]
+
+    def _load_gitignore(self):
+        """Compile the project's .gitignore into a PathSpec (None if unavailable)"""
+        gitignore = self.project_root / '.gitignore'
+        if not pathspec_available or not gitignore.is_file():
+            return None
+        try:
+            with open(gitignore, 'r', encoding='utf-8', errors='replace') as f:
+                return pathspec.PathSpec.from_lines('gitwildmatch', f)
+        except OSError:
+            return None
+
+    def _walk(self) -> Iterator[Tuple[Path, os.stat_result]]:
+        """Yield (path, stat) for every regular file, pruning excluded dirs"""
+        spec = self._load_gitignore()
+        pending = deque([(self.project_root, '')])
+        while pending:
+            directory, rel_dir = pending.popleft()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            rel = rel_dir + entry.name
+                            if entry.is_dir(follow_symlinks=False):
+                                # Prune at the directory boundary (static set + .gitignore)
+                                if entry.name in self.exclude_dirs:
+                                    continue
+                                if spec is not None and spec.match_file(rel + '/'):
+                                    continue
+                                pending.append((Path(entry.path), rel + '/'))
+                            elif entry.is_file():
+                                if spec is not None and spec.match_file(rel):
+                                    continue
+                                yield Path(entry.path), entry.stat()
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
     def should_skip_directory(self, dir_path: Path) -> bool:
         """Check if directory should be skipped"""
         return any(exclude in dir_path.parts for exclude in self.exclude_dirs)
     
-    def should_process_file(self, file_path: Path) -> bool:
+    def should_process_file(self, file_path: Path, file_size: Optional[int] = None) -> bool:
         """Check if file should be processed for duplicates"""
         # Skip binary files that are typically large
         if file_path.suffix.lower() in {'.exe', '.so', '.dylib', '.dll', '.bin'}:
             return False
             
         # Skip very large files (>10MB) for performance
-        try:
-            if file_path.stat().st_size > 10 * 1024 * 1024:
+        if file_size is None:
+            try:
+                file_size = file_path.stat().st_size
+            except OSError:
                 return False
-        except OSError:
+        if file_size > 10 * 1024 * 1024:
             return False
             
         return True
@@ -78,31 +260,95 @@ class FastDuplicateResolver:
     def find_duplicates(self) -> None:
         """Find duplicate files efficiently"""
         print("🔍 Scanning for duplicate files...")
-        hash_to_files: Dict[str, List[Path]] = defaultdict(list)
-        total_files = 0
+        # Structure-of-arrays file table: a file is an index into flat
+        # parallel columns rather than a Path object plus per-file dict entries
+        paths: List[str] = []
+        mtimes = array('q')
+        size_to_files: Dict[int, List[int]] = defaultdict(list)
+        # (digest, file index) pairs; grouped by sorting instead of a dict of lists
+        hashed: List[Tuple[str, int]] = []
         
-        for file_path in self.project_root.rglob("*"):
-            if file_path.is_file():
-                # Skip excluded directories
-                if self.should_skip_directory(file_path):
-                    continue
-                    
-                # Skip non-processable files
-                if not self.should_process_file(file_path):
-                    continue
-                
-                total_files += 1
-                if total_files % 100 == 0:
-                    print(f"   Processed {total_files} files...")
-                
-                file_hash = self.get_file_hash(file_path)
-                if file_hash:
-                    hash_to_files[file_hash].append(file_path)
+        # Pass 1: bucket by size - a file with a unique size cannot have a duplicate
+        for file_path, file_stat in self._walk():
+            file_size = file_stat.st_size
+            
+            # Skip non-processable files
+            if file_path.name == HASH_CACHE_NAME or not self.should_process_file(file_path, file_size):
+                continue
+            
+            index = len(paths)
+            paths.append(str(file_path))
+            mtimes.append(file_stat.st_mtime_ns)
+            size_to_files[file_size].append(index)
+            
+            if len(paths) % 100 == 0:
+                print(f"   Processed {len(paths)} files...")
+        
+        # Pass 2: hash only files whose size collides with another file.
+        # Unchanged files reuse their digest from the persistent cache.
+        # Hashing releases the GIL, so threads overlap disk reads with hashing.
+        # Small files are grouped so per-task dispatch cost is amortised.
+        hash_cache = self._load_hash_cache()
+        small_files: List[Tuple[int, int]] = []
+        large_files: List[Tuple[int, int]] = []
+        prefix_exempt: List[Tuple[int, int]] = []
+        for file_size, indices in size_to_files.items():
+            if len(indices) < 2:
+                continue
+            uncached = []
+            for index in indices:
+                cached = hash_cache.get(paths[index])
+                if cached and cached[0] == file_size and cached[1] == mtimes[index]:
+                    hashed.append((cached[2], index))
+                else:
+                    uncached.append((index, file_size))
+            if file_size <= SMALL_FILE_SIZE:
+                small_files.extend(uncached)
+            elif len(uncached) < len(indices):
+                # Cached peers have no prefix hash to compare against, so the
+                # uncached files in this bucket go straight to the full hash
+                prefix_exempt.extend(uncached)
+            else:
+                large_files.extend(uncached)
         
-        # Filter out unique files (keep only duplicates)
-        for file_hash, files in hash_to_files.items():
-            if len(files) > 1:
-                self.duplicates[file_hash] = files
+        new_cache_entries: List[Tuple[str, int, int, str]] = []
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            # Large files: (size, prefix hash) funnel before the full hash
+            prefix_buckets: Dict[Tuple[int, int], List[Tuple[int, int]]] = defaultdict(list)
+            large_paths = [paths[index] for index, _ in large_files]
+            for item, prefix in zip(large_files, executor.map(self.get_prefix_hash, large_paths)):
+                if prefix is not None:
+                    prefix_buckets[(item[1], prefix)].append(item)
+            
+            batches = [
+                small_files[i:i + SMALL_FILE_BATCH]
+                for i in range(0, len(small_files), SMALL_FILE_BATCH)
+            ]
+            batches.extend(
+                [item]
+                for bucket in prefix_buckets.values() if len(bucket) > 1
+                for item in bucket
+            )
+            batches.extend([item] for item in prefix_exempt)
+            
+            path_batches = [[(paths[index], file_size) for index, file_size in batch] for batch in batches]
+            for batch, digests in zip(batches, executor.map(self._hash_batch, path_batches)):
+                for (index, file_size), file_hash in zip(batch, digests):
+                    if file_hash:
+                        hashed.append((file_hash, index))
+                        new_cache_entries.append(
+                            (paths[index], file_size, mtimes[index], file_hash)
+                        )
+        
+        self._save_hash_cache(new_cache_entries, paths)
+        
+        # Sorting puts equal digests next to each other (index order is walk
+        # order within a run); only runs of two or more become duplicate groups
+        hashed.sort()
+        for file_hash, run in groupby(hashed, key=itemgetter(0)):
+            indices = [index for _, index in run]
+            if len(indices) > 1:
+                self.duplicates[file_hash] = [Path(paths[index]) for index in indices]
         
         print(f"✅ Found {len(self.duplicates)} sets of duplicate files")
 
@@ -145,69 +391,73 @@ class FastDuplicateResolver:
                 print(f"\n... and {remaining} more duplicate groups")
                 break
 
-    def analyze_duplicates(self) -> Dict:
-        """Analyze duplicate files and categorize them"""
-        analysis = {
+    def new_summary(self) -> Dict:
+        """Scalar counters accumulated while duplicate groups are streamed"""
+        return {
             'total_duplicate_sets': len(self.duplicates),
             'total_duplicate_files': 0,
             'potential_space_savings': 0,
-            'safe_to_remove': [],
-            'manual_review_needed': [],
+            'safe_to_remove': 0,
+            'manual_review_needed': 0,
             'by_extension': defaultdict(int),
             'by_directory': defaultdict(int)
         }
-        
+
+    def analyze_duplicates(self, summary: Dict) -> Iterator[Dict]:
+        """Classify duplicate groups one at a time, updating summary counters"""
         for file_hash, files in self.duplicates.items():
             duplicate_count = len(files) - 1  # Keep one original
-            analysis['total_duplicate_files'] += duplicate_count
+            summary['total_duplicate_files'] += duplicate_count
             
             # Calculate space savings
             try:
                 file_size = files[0].stat().st_size
-                analysis['potential_space_savings'] += file_size * duplicate_count
+                summary['potential_space_savings'] += file_size * duplicate_count
             except OSError:
                 continue
             
             # Categorize by extension
             ext = files[0].suffix.lower()
-            analysis['by_extension'][ext] += duplicate_count
+            summary['by_extension'][ext] += duplicate_count
             
             # Categorize by directory
             for file_path in files:
-                analysis['by_directory'][str(file_path.parent)] += 1
+                summary['by_directory'][str(file_path.parent)] += 1
             
             # Determine if safe to auto-remove
             if self._is_safe_to_auto_remove(files):
-                analysis['safe_to_remove'].append({
+                summary['safe_to_remove'] += 1
+                yield {
+                    'type': 'safe_to_remove',
                     'hash': file_hash,
                     'files': [str(f) for f in files],
                     'keep': str(files[0]),  # Keep first one
-                    'remove': [str(f) for f in files[1:]]
-                })
+                    'remove': [str(f) for f in files[1:]],
+                    'size': file_size
+                }
             else:
-                analysis['manual_review_needed'].append({
+                summary['manual_review_needed'] += 1
+                yield {
+                    'type': 'manual_review_needed',
                     'hash': file_hash,
                     'files': [str(f) for f in files],
                     'reason': self._get_manual_review_reason(files)
-                })
-        
-        return analysis
+                }
+
+    def _matches_safe_pattern(self, file_path: Path) -> bool:
+        """Check a path against the safe-to-remove patterns via set lookups"""
+        return (not self.safe_remove_patterns.isdisjoint(file_path.parts)
+                or file_path.suffix in self.safe_remove_patterns)
 
     def _is_safe_to_auto_remove(self, files: List[Path]) -> bool:
         """Determine if duplicates are safe to auto-remove"""
-        # Check if all files are in safe patterns
-        for file_path in files:
-            if any(pattern in str(file_path) for pattern in self.safe_remove_patterns):
-                continue
-            
-            # If files are in different important directories, manual review needed
-            important_dirs = {'src', 'backend', 'frontend', 'api', 'components'}
-            if any(important in file_path.parts for important in important_dirs):
-                # Check if other duplicates are also in important dirs
-                other_important = [f for f in files if f != file_path and 
-                                 any(imp in f.parts for imp in important_dirs)]
-                if other_important:
-                    return False
+        # Files in important directories (one set check per file)
+        important_files = [f for f in files if not IMPORTANT_DIRS.isdisjoint(f.parts)]
+        
+        # If files are in different important directories, manual review needed
+        # (unless every one of them matches a safe pattern)
+        if len(important_files) > 1:
+            return all(self._matches_safe_pattern(f) for f in important_files)
         
         return True
 
@@ -216,8 +466,7 @@ class FastDuplicateResolver:
         reasons = []
         
         # Check for important directories
-        important_dirs = {'src', 'backend', 'frontend', 'api', 'components'}
-        important_files = [f for f in files if any(imp in f.parts for imp in important_dirs)]
+        important_files = [f for f in files if not IMPORTANT_DIRS.isdisjoint(f.parts)]
         
         if len(important_files) > 1:
             reasons.append("Multiple files in important directories")
@@ -234,35 +483,46 @@ class FastDuplicateResolver:
             
         return "; ".join(reasons) if reasons else "Requires manual verification"
 
-    def auto_resolve_safe_duplicates(self, analysis: Dict) -> None:
-        """Automatically resolve safe duplicate files"""
+    def auto_resolve_safe_duplicates(self, items: Iterable[Dict]) -> None:
+        """Automatically resolve safe duplicate files (consumes items lazily)"""
         print("\n🔧 Auto-resolving safe duplicates...")
         
-        for item in analysis['safe_to_remove']:
-            try:
-                keep_file = Path(item['keep'])
+        # Paths are plain strings under project_root: strip the prefix for display
+        root_prefix = str(self.project_root).rstrip(os.sep) + os.sep
+        lines: List[str] = []
+        
+        for item in items:
+            file_size = item['size']
+            for remove_file in item['remove']:
+                try:
+                    os.unlink(remove_file)
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    lines.append(f"   ❌ Error removing {remove_file}: {e}")
+                    continue
+                
+                self.resolved_count += 1
+                self.saved_space += file_size
                 
-                for remove_file_str in item['remove']:
-                    remove_file = Path(remove_file_str)
-                    
-                    if remove_file.exists():
-                        file_size = remove_file.stat().st_size
-                        remove_file.unlink()
-                        
-                        self.resolved_count += 1
-                        self.saved_space += file_size
-                        
-                        print(f"   ✅ Removed: {remove_file.relative_to(self.project_root)}")
-                        
-            except Exception as e:
-                print(f"   ❌ Error removing {remove_file_str}: {e}")
-
-    def generate_report(self, analysis: Dict) -> None:
-        """Generate comprehensive duplicate analysis report"""
+                display = remove_file[len(root_prefix):] if remove_file.startswith(root_prefix) else remove_file
+                lines.append(f"   ✅ Removed: {display}")
+            
+            # Coalesce console output into occasional large writes
+            if len(lines) >= LOG_FLUSH_LINES:
+                sys.stdout.write('\n'.join(lines) + '\n')
+                lines.clear()
+        
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
+
+    def generate_report(self, summary: Dict) -> None:
+        """Generate the duplicate analysis summary (groups are in the NDJSON report)"""
         report = {
             'timestamp': __import__('datetime').datetime.now().isoformat(),
             'project_root': str(self.project_root),
-            'analysis': analysis,
+            'analysis': summary,
+            'groups_report': GROUPS_REPORT_NAME,
             'resolved': {
                 'auto_resolved_count': self.resolved_count,
                 'space_saved_bytes': self.saved_space,
@@ -271,8 +531,13 @@ class FastDuplicateResolver:
         }
         
         report_file = self.project_root / 'DUPLICATE_ANALYSIS_REPORT.json'
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson_available:
+            # Rust encoder: much faster than json.dump on large analyses
+            with open(report_file, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_file, 'w') as f:
+                json.dump(report, f, indent=2)
         
         print(f"\n📊 Report saved to: {report_file}")
 
@@ -289,51 +554,73 @@ class FastDuplicateResolver:
             print("✅ No duplicate files found!")
             return
         
-        # Step 2: Analyze duplicates
+        # Step 2: Analyze duplicates, streaming each group to the NDJSON report
+        # and auto-resolving safe groups as they are classified
         print("\n📊 Analyzing duplicates...")
-        analysis = self.analyze_duplicates()
+        summary = self.new_summary()
+        manual_preview: List[Dict] = []
+        groups_file = self.project_root / GROUPS_REPORT_NAME
+        
+        with open(groups_file, 'wb') as f:
+            def safe_groups() -> Iterator[Dict]:
+                for item in self.analyze_duplicates(summary):
+                    f.write(_dump_record(item))
+                    if item['type'] == 'safe_to_remove':
+                        yield item
+                    elif len(manual_preview) < MANUAL_REVIEW_PREVIEW:
+                        manual_preview.append(item)
+            
+            # Step 3: Auto-resolve safe duplicates
+            self.auto_resolve_safe_duplicates(safe_groups())
         
-        # Step 3: Display summary
+        # Step 4: Display summary
         print(f"\n📈 DUPLICATE ANALYSIS SUMMARY:")
-        print(f"   Total duplicate sets: {analysis['total_duplicate_sets']}")
-        print(f"   Total duplicate files: {analysis['total_duplicate_files']}")
-        print(f"   Potential space savings: {analysis['potential_space_savings'] / (1024*1024):.2f} MB")
-        print(f"   Safe to auto-remove: {len(analysis['safe_to_remove'])}")
-        print(f"   Need manual review: {len(analysis['manual_review_needed'])}")
+        print(f"   Total duplicate sets: {summary['total_duplicate_sets']}")
+        print(f"   Total duplicate files: {summary['total_duplicate_files']}")
+        print(f"   Potential space savings: {summary['potential_space_savings'] / (1024*1024):.2f} MB")
+        print(f"   Safe to auto-remove: {summary['safe_to_remove']}")
+        print(f"   Need manual review: {summary['manual_review_needed']}")
         
-        # Step 4: Auto-resolve safe duplicates
-        if analysis['safe_to_remove']:
-            self.auto_resolve_safe_duplicates(analysis)
-            
+        if summary['safe_to_remove']:
             print(f"\n✅ AUTO-RESOLUTION COMPLETE:")
             print(f"   Files removed: {self.resolved_count}")
             print(f"   Space saved: {self.saved_space / (1024*1024):.2f} MB")
         
         # Step 5: Generate report
-        self.generate_report(analysis)
+        self.generate_report(summary)
+        print(f"📄 Duplicate groups: {groups_file}")
         
         # Step 6: Display manual review needed
-        if analysis['manual_review_needed']:
-            print(f"\n⚠️  MANUAL REVIEW NEEDED ({len(analysis['manual_review_needed'])} items):")
-            for i, item in enumerate(analysis['manual_review_needed'][:5], 1):  # Show first 5
+        if manual_preview:
+            print(f"\n⚠️  MANUAL REVIEW NEEDED ({summary['manual_review_needed']} items):")
+            for i, item in enumerate(manual_preview, 1):  # Show first 5
                 print(f"   {i}. {item['reason']}:")
                 for file_path in item['files']:
                     print(f"      - {file_path}")
                 print()
             
-            if len(analysis['manual_review_needed']) > 5:
-                print(f"   ... and {len(analysis['manual_review_needed']) - 5} more items")
+            if summary['manual_review_needed'] > MANUAL_REVIEW_PREVIEW:
+                print(f"   ... and {summary['manual_review_needed'] - MANUAL_REVIEW_PREVIEW} more items")
                 print("   📄 See full report for details")
 
-
 def main():
+    parser = argparse.ArgumentParser(
+        description="Fast duplicate file scanner for the ZeroDev AI project."
+    )
+    parser.add_argument(
+        "--secure",
+        action="store_true",
+        help="Use SHA-256 content digests instead of the fast non-cryptographic hash.",
+    )
+    args = parser.parse_args()
+
     project_root = "/workspaces/ZeroDev_AI"
     
     if not Path(project_root).exists():
         print(f"❌ Project root not found: {project_root}")
         return
     
-    resolver = FastDuplicateResolver(project_root)
+    resolver = FastDuplicateResolver(project_root, secure=args.secure)
     
     print("🔍 Fast Duplicate Scan Starting (SAFETY MODE)...")
     resolver.find_duplicates()
@@ -7,6 +7,16 @@ import json
 import shutil
 from pathlib import Path
 from datetime import datetime
+try:
+    import orjson  # type: ignore
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+
+# Cache directories removed wholesale (never descended into)
+CACHE_DIRS = frozenset({"__pycache__", ".pytest_cache", "node_modules", ".next", ".venv"})
+# Directories that never hold caches worth cleaning
+PRUNE_DIRS = frozenset({".git"})
 
 def main():
     print("🧹 Final Project Cleanup")
@@ -19,6 +29,7 @@ def main():
     report_files = [
         "CLEANUP_REPORT.json",
         "DUPLICATE_ANALYSIS_REPORT.json", 
+        "DUPLICATE_ANALYSIS_REPORT.ndjson",
         "NAMING_FIXES_REPORT.json",
         "PROJECT_ANALYSIS_REPORT.json"
     ]
@@ -34,22 +45,30 @@ def main():
     
     # 2. Clean up cache files
     print("\n2️⃣ Cleaning up cache files...")
-    cache_patterns = [
-        "**/__pycache__",
-        "**/*.pyc",
-        "**/.pytest_cache",
-        "**/node_modules", 
-        "**/.next",
-        "**/.venv"
-    ]
-    
+    # Single top-down walk: cache directories are removed and pruned in place
     cache_cleaned = 0
-    for pattern in cache_patterns:
-        for path in project_root.glob(pattern):
-            if path.is_dir():
+    pyc_cleaned = 0
+    for dirpath, dirs, files in os.walk(project_root, topdown=True):
+        kept = []
+        for d in dirs:
+            if d in CACHE_DIRS:
+                path = Path(dirpath) / d
                 shutil.rmtree(path, ignore_errors=True)
                 cache_cleaned += 1
                 print(f"   🗑️ Removed {path.relative_to(project_root)}")
+            elif d not in PRUNE_DIRS:
+                kept.append(d)
+        dirs[:] = kept
+        
+        for name in files:
+            if name.endswith(".pyc"):
+                path = Path(dirpath) / name
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                pyc_cleaned += 1
+                print(f"   🗑️ Removed {path.relative_to(project_root)}")
     
     # 3. Validate file structure
     print("\n3️⃣ Validating project structure...")
@@ -74,6 +93,7 @@ def main():
     print(f"\n📊 Cleanup Summary:")
     print(f"   📁 Reports archived: {cleaned_files}")
     print(f"   🗑️ Cache directories removed: {cache_cleaned}")
+    print(f"   🗑️ Stray .pyc files removed: {pyc_cleaned}")
     print(f"   📋 File structure valid: {'✅ Yes' if all_valid else '❌ No'}")
     
     # 5. Create cleanup completion file
@@ -81,12 +101,18 @@ def main():
         "cleanup_date": datetime.now().isoformat(),
         "reports_archived": cleaned_files,
         "cache_cleaned": cache_cleaned, 
+        "pyc_files_removed": pyc_cleaned,
         "structure_valid": all_valid,
         "status": "completed"
     }
     
-    with open(project_root / "scripts" / "cleanup_completion.json", "w") as f:
-        json.dump(completion_info, f, indent=2)
+    completion_path = project_root / "scripts" / "cleanup_completion.json"
+    if orjson_available:
+        with open(completion_path, "wb") as f:
+            f.write(orjson.dumps(completion_info, option=orjson.OPT_INDENT_2))
+    else:
+        with open(completion_path, "w") as f:
+            json.dump(completion_info, f, indent=2)
     
     print(f"\n🎉 Final cleanup completed successfully!")
     print(f"📝 Completion report saved to scripts/cleanup_completion.json")
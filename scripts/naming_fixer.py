@@ -12,14 +12,52 @@ Bu script naming convention'larni to'g'rilaydi:
 import os
 import json
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Set, Tuple
+try:
+    import orjson  # type: ignore
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+
+# Regex'lar bir marta compile qilinadi (har bir file uchun emas)
+_PY_NAME_RE = re.compile(r'^[a-z][a-z0-9_]*$')
+_JS_NAME_RE = re.compile(r'^[a-z][a-zA-Z0-9]*$|^[a-z][a-z0-9-]*$')
+_DIR_NAME_RE = re.compile(r'^[a-z][a-z0-9-]*$')
+_CAMEL1 = re.compile(r'(.)([A-Z][a-z]+)')
+_CAMEL2 = re.compile(r'([a-z0-9])([A-Z])')
+_NON_SNAKE = re.compile(r'[^a-z0-9_]')
+_NON_KEBAB = re.compile(r'[^a-z0-9-]')
+_MULTI_UNDERSCORE = re.compile(r'_+')
+_MULTI_DASH = re.compile(r'-+')
+
+# File rename'lar parallel bajariladi (rename - metadata I/O, GIL'ni bo'shatadi)
+RENAME_WORKERS = 32
+
+# Nuqta bilan boshlanadigan barcha katalog/file'lar ham skip qilinadi
+# (.git, .github, .gitlab, .vscode ...) - ularning nomlari tool'lar uchun muhim
+SKIP_PATTERNS = frozenset({
+    '.venv',
+    'node_modules',
+    '.git',
+    '__pycache__',
+    '.next',
+    'dist',
+    'build',
+    '.pytest_cache'
+})
+JS_SUFFIXES = frozenset({'.tsx', '.ts', '.js'})
 
 class NamingFixer:
     def __init__(self, project_root: str):
         self.project_root = Path(project_root)
         self.fixes_applied = []
         self.skipped_files = []
+        self._skip_set = SKIP_PATTERNS
+        # Bitta walk natijasi: (python files, js/ts files, directories)
+        self._entries: Optional[Tuple[List[Path], List[Path], List[Path]]] = None
     
     def fix_naming_issues(self):
         """Naming issues'ni to'g'rilash"""
@@ -40,7 +78,9 @@ class NamingFixer:
         """Python file naming'ni to'g'rilash"""
         print("🐍 Python files'ni tekshirayapman...")
         
-        python_files = list(self.project_root.rglob("*.py"))
+        python_files, _, _ = self._scan_entries()
+        plan = []
+        claimed: Set[Path] = set()
         
         for py_file in python_files:
             if self._should_skip_file(py_file):
@@ -49,35 +89,23 @@ class NamingFixer:
             filename = py_file.stem
             
             # snake_case'ga o'tkazish kerak bo'lgan file'lar
-            if not re.match(r'^[a-z][a-z0-9_]*$', filename) and filename != '__init__':
+            if not _PY_NAME_RE.match(filename) and filename != '__init__':
                 new_name = self._to_snake_case(filename)
                 new_path = py_file.parent / f"{new_name}.py"
                 
-                if not new_path.exists() and new_name != filename:
-                    try:
-                        py_file.rename(new_path)
-                        self.fixes_applied.append({
-                            'type': 'python_rename',
-                            'old': str(py_file),
-                            'new': str(new_path),
-                            'change': f"{filename} → {new_name}"
-                        })
-                        print(f"  ✅ Renamed: {filename} → {new_name}")
-                    except Exception as e:
-                        self.skipped_files.append({
-                            'file': str(py_file),
-                            'reason': str(e)
-                        })
+                if new_path not in claimed and not new_path.exists() and new_name != filename:
+                    claimed.add(new_path)
+                    plan.append((py_file, new_path, filename, new_name))
+        
+        self._apply_file_renames(plan, 'python_rename')
     
     def _fix_js_naming(self):
         """JavaScript/TypeScript file naming'ni to'g'rilash"""
         print("🟨 TypeScript/JS files'ni tekshirayapman...")
         
-        js_files = (
-            list(self.project_root.rglob("*.tsx")) + 
-            list(self.project_root.rglob("*.ts")) + 
-            list(self.project_root.rglob("*.js"))
-        )
+        _, js_files, _ = self._scan_entries()
+        plan = []
+        claimed: Set[Path] = set()
         
         for js_file in js_files:
             if self._should_skip_file(js_file):
@@ -86,70 +114,118 @@ class NamingFixer:
             filename = js_file.stem
             
             # Agar camelCase yoki kebab-case emas bo'lsa
-            if not re.match(r'^[a-z][a-zA-Z0-9]*$|^[a-z][a-z0-9-]*$', filename):
+            if not _JS_NAME_RE.match(filename):
                 # kebab-case'ga o'tkazish
                 new_name = self._to_kebab_case(filename)
                 new_path = js_file.parent / f"{new_name}{js_file.suffix}"
                 
-                if not new_path.exists() and new_name != filename:
+                if new_path not in claimed and not new_path.exists() and new_name != filename:
+                    claimed.add(new_path)
+                    plan.append((js_file, new_path, filename, new_name))
+        
+        self._apply_file_renames(plan, 'js_rename')
+    
+    def _apply_file_renames(self, plan: List[Tuple[Path, Path, str, str]], fix_type: str):
+        """Rename rejasini thread pool'da bajarish; natijalar reja tartibida yoziladi"""
+        if not plan:
+            return
+        
+        with ThreadPoolExecutor(max_workers=RENAME_WORKERS) as executor:
+            futures = [executor.submit(os.rename, old, new) for old, new, _, _ in plan]
+            
+            for (old_path, new_path, old_name, new_name), future in zip(plan, futures):
+                try:
+                    future.result()
+                    self.fixes_applied.append({
+                        'type': fix_type,
+                        'old': str(old_path),
+                        'new': str(new_path),
+                        'change': f"{old_name} → {new_name}"
+                    })
+                    print(f"  ✅ Renamed: {old_name} → {new_name}")
+                except Exception as e:
+                    self.skipped_files.append({
+                        'file': str(old_path),
+                        'reason': str(e)
+                    })
+    
+    def _fix_directory_naming(self):
+        """Directory naming'ni to'g'rilash"""
+        print("📁 Directory names'ni tekshirayapman...")
+        
+        _, _, directories = self._scan_entries()
+        
+        # Katalog rename'lar ketma-ket va file rename'lardan keyin qoladi:
+        # eng chuqur katalog'dan boshlab - parent rename child path'larini buzmasligi uchun
+        for dir_path in sorted(directories, key=lambda d: len(d.parts), reverse=True):
+            if self._should_skip_file(dir_path):
+                continue
+                
+            dir_name = dir_path.name
+            
+            # Lowercase va kebab-case'ga o'tkazish
+            if not _DIR_NAME_RE.match(dir_name):
+                new_name = self._to_kebab_case(dir_name)
+                new_path = dir_path.parent / new_name
+                
+                if not new_path.exists() and new_name != dir_name:
                     try:
-                        js_file.rename(new_path)
+                        dir_path.rename(new_path)
                         self.fixes_applied.append({
-                            'type': 'js_rename',
-                            'old': str(js_file),
+                            'type': 'directory_rename',
+                            'old': str(dir_path),
                             'new': str(new_path),
-                            'change': f"{filename} → {new_name}"
+                            'change': f"{dir_name} → {new_name}"
                         })
-                        print(f"  ✅ Renamed: {filename} → {new_name}")
+                        print(f"  ✅ Directory renamed: {dir_name} → {new_name}")
                     except Exception as e:
                         self.skipped_files.append({
-                            'file': str(js_file),
+                            'file': str(dir_path),
                             'reason': str(e)
                         })
     
-    def _fix_directory_naming(self):
-        """Directory naming'ni to'g'rilash"""
-        print("📁 Directory names'ni tekshirayapman...")
-        
-        for dir_path in self.project_root.rglob("*"):
-            if dir_path.is_dir() and self._should_skip_file(dir_path):
+    def _iter_entries(self):
+        """Har bir file/katalog'ni bir marta (path, is_dir) qilib berish, skip katalog'lar kesiladi"""
+        pending = deque([self.project_root])
+        while pending:
+            directory = pending.popleft()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if self._is_skipped_name(entry.name):
+                            continue
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        if is_dir:
+                            pending.append(Path(entry.path))
+                        yield Path(entry.path), is_dir
+            except OSError:
                 continue
-                
-            if dir_path.is_dir():
-                dir_name = dir_path.name
-                
-                # Lowercase va kebab-case'ga o'tkazish
-                if not re.match(r'^[a-z][a-z0-9-]*$', dir_name):
-                    new_name = self._to_kebab_case(dir_name)
-                    new_path = dir_path.parent / new_name
-                    
-                    if not new_path.exists() and new_name != dir_name:
-                        try:
-                            dir_path.rename(new_path)
-                            self.fixes_applied.append({
-                                'type': 'directory_rename',
-                                'old': str(dir_path),
-                                'new': str(new_path),
-                                'change': f"{dir_name} → {new_name}"
-                            })
-                            print(f"  ✅ Directory renamed: {dir_name} → {new_name}")
-                        except Exception as e:
-                            self.skipped_files.append({
-                                'file': str(dir_path),
-                                'reason': str(e)
-                            })
+    
+    def _scan_entries(self) -> Tuple[List[Path], List[Path], List[Path]]:
+        """Bitta walk'ni suffix bo'yicha ajratib, barcha fixer'lar uchun cache qilish"""
+        if self._entries is None:
+            python_files, js_files, directories = [], [], []
+            for path, is_dir in self._iter_entries():
+                if is_dir:
+                    directories.append(path)
+                elif path.suffix == '.py':
+                    python_files.append(path)
+                elif path.suffix in JS_SUFFIXES:
+                    js_files.append(path)
+            self._entries = (python_files, js_files, directories)
+        return self._entries
     
     def _to_snake_case(self, text: str) -> str:
         """String'ni snake_case'ga o'tkazish"""
         # CamelCase'dan snake_case'ga
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', text)
-        s2 = re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+        s1 = _CAMEL1.sub(r'\1_\2', text)
+        s2 = _CAMEL2.sub(r'\1_\2', s1).lower()
         
         # Special characters'ni _ bilan almashtirish
-        s3 = re.sub(r'[^a-z0-9_]', '_', s2)
+        s3 = _NON_SNAKE.sub('_', s2)
         
         # Multiple _ larni bitta _'ga aylantirish
-        s4 = re.sub(r'_+', '_', s3)
+        s4 = _MULTI_UNDERSCORE.sub('_', s3)
         
         # Boshlanish va tugashdan _'ni olib tashlash
         return s4.strip('_')
@@ -157,33 +233,29 @@ class NamingFixer:
     def _to_kebab_case(self, text: str) -> str:
         """String'ni kebab-case'ga o'tkazish"""
         # CamelCase'dan kebab-case'ga
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1-\2', text)
-        s2 = re.sub('([a-z0-9])([A-Z])', r'\1-\2', s1).lower()
+        s1 = _CAMEL1.sub(r'\1-\2', text)
+        s2 = _CAMEL2.sub(r'\1-\2', s1).lower()
         
         # Special characters'ni - bilan almashtirish
-        s3 = re.sub(r'[^a-z0-9-]', '-', s2)
+        s3 = _NON_KEBAB.sub('-', s2)
         
         # Multiple - larni bitta -'ga aylantirish
-        s4 = re.sub(r'-+', '-', s3)
+        s4 = _MULTI_DASH.sub('-', s3)
         
         # Boshlanish va tugashdan -'ni olib tashlash
         return s4.strip('-')
     
+    def _is_skipped_name(self, name: str) -> bool:
+        """Bitta path komponenti skip qilinadimi? (dot-file/katalog yoki SKIP_PATTERNS)"""
+        return name.startswith('.') or name in self._skip_set
+    
     def _should_skip_file(self, file_path: Path) -> bool:
-        """Skip qilinadigan file'lar"""
-        skip_patterns = [
-            '.venv',
-            'node_modules', 
-            '.git',
-            '__pycache__',
-            '.next',
-            'dist',
-            'build',
-            '.pytest_cache'
-        ]
-        
-        str_path = str(file_path)
-        return any(pattern in str_path for pattern in skip_patterns)
+        """Skip qilinadigan file'lar (project root'dan nisbiy komponentlar bo'yicha)"""
+        try:
+            parts = file_path.relative_to(self.project_root).parts
+        except ValueError:
+            parts = file_path.parts
+        return any(self._is_skipped_name(part) for part in parts)
     
     def _generate_report(self):
         """Report yaratish"""
@@ -211,8 +283,14 @@ class NamingFixer:
             'summary': fixes_by_type
         }
         
-        with open(self.project_root / 'NAMING_FIXES_REPORT.json', 'w') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        report_path = self.project_root / 'NAMING_FIXES_REPORT.json'
+        if orjson_available:
+            # orjson UTF-8 bytes yozadi (ensure_ascii=False bilan bir xil)
+            with open(report_path, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_path, 'w') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
         
         print(f"\n📄 Naming fixes report: NAMING_FIXES_REPORT.json")
         print("=" * 60)
@@ -10,21 +10,261 @@ Bu script loyihadagi barcha muammolarni aniqlaydi:
 - Import cycles
 - Dead code
 - File naming inconsistencies
+
+Tezroq ishga tushirish (ixtiyoriy, manba o'zgarmaydi):
+- ``pypy3 scripts/project_analyzer.py`` - faqat stdlib ishlatiladi
+- ``mypyc scripts/project_analyzer.py`` - native extension yasaydi; ``.so`` yonida
+  turgan bo'lsa ``import project_analyzer`` uni avtomatik oladi
 """
 
 import os
 import ast
 import hashlib
 import json
+import mmap
+import sqlite3
+import threading
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
 from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import re
+try:
+    import xxhash  # type: ignore
+    xxhash_available = True
+except ImportError:
+    xxhash_available = False
+try:
+    import orjson  # type: ignore
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+
+# Katta file'lar shu o'lchamdagi bo'laklar bilan hash qilinadi
+HASH_CHUNK_SIZE = 1024 * 1024
+# Hash thread'lari: read() va hash update GIL'siz, shuning uchun kam yadroli
+# mashinada ham diskka kamida 16 ta parallel so'rov yuboriladi
+HASH_WORKERS = max(16, (os.cpu_count() or 1) * 2)
+# Incremental tahlil cache'i: (path, mtime_ns, size) bo'yicha hash va AST natijalari
+ANALYSIS_CACHE_NAME = '.zerodev_analysis.db'
+# Cache jadvallari sxemasi o'zgarsa oshiriladi (eski jadvallar tashlab yuboriladi)
+CACHE_SCHEMA_VERSION = 3
+# Bundan katta .py file'lar code duplicate uchun parse qilinmaydi (odatda generated)
+MAX_CODE_SCAN_SIZE = 512 * 1024
+# Kamida shuncha .py file bo'lsa parse ProcessPool'da bajariladi
+PARALLEL_PARSE_MIN_FILES = 64
+# Import qatorlari faqat file boshidagi shuncha qatordan qidiriladi
+IMPORT_SCAN_LINES = 500
+# Bundan katta file'lar mmap orqali hash qilinadi
+MMAP_THRESHOLD = 64 * 1024 * 1024
+# Tezkor hash: file boshidan va oxiridan olinadigan bayt'lar
+QUICK_HASH_SIZE = 4096
+# Walk paytida ichiga kirilmaydigan katalog'lar (aniq nom bo'yicha)
+IGNORE_DIRS = frozenset({
+    '__pycache__', '.git', '.next', 'node_modules', '.pytest_cache',
+    'dist', 'build', '.vscode', '.idea', '.venv', 'venv'
+})
+# Ignore qilinadigan file kengaytmalari
+IGNORE_SUFFIXES = frozenset({'.pyc', '.log'})
+# Cache katalog'lari (ignore qilinganlari ham walk paytida qayd etiladi)
+CACHE_DIRS = frozenset({
+    '__pycache__', '.pytest_cache', 'node_modules', '.next', 'dist', 'build', '.cache'
+})
+JS_SUFFIXES = frozenset({'.tsx', '.ts', '.js'})
+# Bir nechta nusxasi conflict deb hisoblanadigan config file'lar
+CONFIG_NAMES = frozenset({
+    'package.json', 'pyproject.toml', 'requirements.txt', 'tsconfig.json', 'next.config.mjs'
+})
+# 1MB dan katta file'lar - potensial cache muammosi
+LARGE_FILE_SIZE = 1024 * 1024
+# Naming convention regex'lari bir marta compile qilinadi
+_SNAKE_MATCH = re.compile(r'^[a-z][a-z0-9_]*$').match
+_JS_NAME_MATCH = re.compile(r'^[a-z][a-zA-Z0-9]*$|^[a-z][a-z0-9-]*$').match
+# str.splitlines() bularni ham qator chegarasi deb biladi, ast esa yo'q
+_EXTRA_LINE_BREAKS = re.compile('[\v\f\x1c\x1d\x1e\x85\u2028\u2029]')
+
+# Thread'ga xos qayta ishlatiladigan o'qish buffer'lari (_full_hash)
+_thread_buffers = threading.local()
+
+
+def _hash_algorithm() -> str:
+    """Joriy hasher nomi (cache'dagi digest'lar aralashmasligi uchun)"""
+    return 'xxh3_128' if xxhash_available else 'blake2b-128'
+
+
+def _new_hasher() -> Any:
+    """Content fingerprint uchun tez hasher (xxh3_128, bo'lmasa blake2b-128)"""
+    if xxhash_available:
+        return xxhash.xxh3_128()
+    return hashlib.blake2b(digest_size=16)
+
+
+def _quick_hash(path: str, size: int) -> Optional[str]:
+    """Boshi va oxiridagi 4 KiB bo'yicha hash (<= 8 KiB file'lar uchun bu to'liq hash)"""
+    try:
+        hasher = _new_hasher()
+        with open(path, 'rb') as f:
+            hasher.update(f.read(QUICK_HASH_SIZE))
+            if size > QUICK_HASH_SIZE:
+                f.seek(max(size - QUICK_HASH_SIZE, QUICK_HASH_SIZE))
+                hasher.update(f.read(QUICK_HASH_SIZE))
+        return hasher.hexdigest()
+    except OSError:
+        return None
+
+
+def _full_hash(path: str) -> Optional[str]:
+    """File'ni doimiy xotira bilan to'liq hash qilish (katta file'lar mmap orqali)"""
+    try:
+        hasher = _new_hasher()
+        with open(path, 'rb', buffering=0) as f:
+            fd = f.fileno()
+            if hasattr(os, 'posix_fadvise'):
+                # Kernel'ga ketma-ket o'qish haqida aytish - read-ahead kattalashadi
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            if os.fstat(fd).st_size > MMAP_THRESHOLD:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+            else:
+                # Har bir thread o'zining 1 MiB buffer'ini qayta ishlatadi
+                buf = getattr(_thread_buffers, 'buf', None)
+                if buf is None:
+                    buf = _thread_buffers.buf = bytearray(HASH_CHUNK_SIZE)
+                view = memoryview(buf)
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    hasher.update(view[:n])
+        return hasher.hexdigest()
+    except (OSError, ValueError):
+        return None
+
+
+def _source_segment(lines: List[str], node: Any) -> str:
+    """ast.get_source_segment bilan bir xil natija, lekin oldindan bo'lingan qatorlardan"""
+    start, end = node.lineno - 1, node.end_lineno - 1
+    if start == end:
+        return lines[start].encode()[node.col_offset:node.end_col_offset].decode()
+    first = lines[start].encode()[node.col_offset:].decode()
+    last = lines[end].encode()[:node.end_col_offset].decode()
+    return first + ''.join(lines[start + 1:end]) + last
+
+
+def _is_generated_source(path: str) -> bool:
+    """Migration kabi avtomatik yaratilgan modul'lar (duplicate code uchun foydasiz)"""
+    return (f'{os.sep}migrations{os.sep}' in path
+            or f'{os.sep}alembic{os.sep}versions{os.sep}' in path)
+
+
+def _dump_summary(result: Dict[str, Any]) -> bytes:
+    """AST summary'ni cache uchun JSON'ga aylantirish (faqat list, str va int)"""
+    if orjson_available:
+        return orjson.dumps(result)
+    return json.dumps(result, separators=(',', ':')).encode()
+
+
+def _load_summary(blob: Any) -> Optional[Dict[str, Any]]:
+    """Cache'dagi JSON summary'ni o'qish; buzilgan yoki begona qator - cache miss (None)
+
+    Cache DB skan qilinayotgan loyiha ichida turadi, shuning uchun uning
+    mazmuniga ishonilmaydi: pickle emas, faqat JSON va tuzilma tekshiruvi."""
+    try:
+        result = orjson.loads(blob) if orjson_available else json.loads(blob)
+    except (TypeError, ValueError):
+        return None
+    if (not isinstance(result, dict)
+            or not all(isinstance(result.get(key), list) for key in ('blocks', 'imports', 'import_lines'))):
+        return None
+    return result
+
+
+def _analyze_py_file(path: str, find_blocks: bool = True) -> Dict[str, Any]:
+    """Bitta .py file'ni bir marta o'qib, bir marta parse qilish (ProcessPool worker)
+
+    Natija: katta function/class'lar (hash, name, type, line), import qilingan
+    modullar va import qatorlari (dead code tekshiruvi uchun). ``find_blocks``
+    False bo'lsa (katta yoki generated file) code block'lar qidirilmaydi.
+    """
+    result: Dict[str, Any] = {'blocks': [], 'imports': [], 'import_lines': []}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except (OSError, UnicodeDecodeError):
+        return result
+    
+    # Basic unused import detection uchun import qatorlari - import'lar deyarli
+    # har doim file boshida, shuning uchun butun file qatorlarga bo'linmaydi
+    head = content.split('\n', IMPORT_SCAN_LINES)[:IMPORT_SCAN_LINES]
+    for line_num, line in enumerate(head, 1):
+        if line.strip().startswith(('import ', 'from ')) and 'import' in line:
+            result['import_lines'].append((line_num, line.strip()))
+    
+    # Generated file yoki def/class'siz file'dan code block chiqmaydi
+    if find_blocks:
+        first_line = content[:content.find('\n')] if '\n' in content else content
+        find_blocks = ('# generated' not in first_line.lower()
+                       and ('def ' in content or 'class ' in content))
+    # Code block ham, import ham bo'lmasa parse qilishning hojati yo'q
+    if not find_blocks and 'import' not in content:
+        return result
+    
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError, RecursionError, MemoryError):
+        return result
+    
+    # Manba bir marta bo'linadi (get_source_segment har node uchun qayta bo'ladi)
+    lines = None if _EXTRA_LINE_BREAKS.search(content) else content.splitlines(keepends=True)
+    blocks, imports = result['blocks'], result['imports']
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+            if not find_blocks:
+                continue
+            code_snippet: Optional[str]
+            if lines is not None:
+                code_snippet = _source_segment(lines, node)
+            else:
+                code_snippet = ast.get_source_segment(content, node)
+            if code_snippet and len(code_snippet) > 100:  # Kichik function'larni ignore
+                hasher = _new_hasher()
+                hasher.update(code_snippet.encode())
+                code_hash = hasher.hexdigest()
+                blocks.append((code_hash, node.name, type(node).__name__, node.lineno))
+        elif isinstance(node, ast.Import):
+            imports.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                imports.append(node.module)
+    return result
+
+
+def _is_snake_case(name: str) -> bool:
+    """^[a-z][a-z0-9_]*$ tekshiruvi; ko'p uchraydigan (mos) holat regex'siz"""
+    if name.isascii() and name[:1].isalpha() and name.islower() and name.replace('_', 'a').isalnum():
+        return True
+    return _SNAKE_MATCH(name) is not None
+
+
+def _add_grouped(first: Dict[Any, Any], groups: Dict[Any, List[Any]], key: Any, value: Any) -> None:
+    """Faqat takrorlangan key'lar uchun guruh yig'ish
+
+    Key birinchi marta ``first``'ga yagona qiymat sifatida yoziladi; list faqat
+    ikkinchi uchrashuvda ``groups``'da yaratiladi (ko'p key'lar yagona bo'ladi).
+    """
+    group = groups.get(key)
+    if group is not None:
+        group.append(value)
+    elif key in first:
+        groups[key] = [first.pop(key), value]
+    else:
+        first[key] = value
+
 
 class ProjectAnalyzer:
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str) -> None:
         self.project_root = Path(project_root)
-        self.issues = {
+        self.issues: Dict[str, List[Dict[str, Any]]] = {
             'duplicates': [],
             'cache_issues': [],
             'architecture_violations': [],
@@ -33,6 +273,12 @@ class ProjectAnalyzer:
             'dead_code': [],
             'config_conflicts': []
         }
+        # Bitta walk natijasi (_scan_once), barcha tahlil bosqichlari qayta ishlatadi
+        self._scan: Optional[Dict[str, Any]] = None
+        # Walk yo'llari shu prefiks bilan boshlanadi; parts ajratish uchun kesib tashlanadi
+        self._root_prefix_len = len(os.path.join(str(self.project_root), ''))
+        # .py file'lar bo'yicha parse natijalari (_parse_python_files)
+        self._py_results: Optional[Dict[str, Dict[str, Any]]] = None
     
     def analyze(self) -> Dict[str, Any]:
         """Loyihani to'liq tahlil qilish"""
@@ -49,106 +295,281 @@ class ProjectAnalyzer:
         
         return self._generate_report()
     
-    def _find_duplicate_files(self):
+    def _find_duplicate_files(self) -> None:
         """Bir xil content'ga ega file'larni topish"""
         print("📄 Duplicate file'larni qidirayapman...")
         
-        file_hashes = defaultdict(list)
+        scan = self._scan_once()
+        sizes = dict(scan['files'])
+        mtimes = scan['mtimes']
+        algorithm = _hash_algorithm()
+        hash_cache = self._load_cache('hashes')
         
-        for file_path in self.project_root.rglob("*"):
-            if file_path.is_file() and not self._should_ignore_file(file_path):
-                try:
-                    with open(file_path, 'rb') as f:
-                        content = f.read()
-                        file_hash = hashlib.md5(content).hexdigest()
-                        file_hashes[file_hash].append(str(file_path))
-                except:
+        # 1-bosqich: o'lcham bo'yicha guruhlash - yagona o'lchamdagi file duplicate bo'lolmaydi
+        first_by_size: Dict[int, str] = {}
+        size_buckets: Dict[int, List[str]] = {}
+        for path, size in scan['files']:
+            if not self._should_ignore_file(path):
+                _add_grouped(first_by_size, size_buckets, size, path)
+        del first_by_size
+        
+        # O'zgarmagan file'lar digest'i cache'dan olinadi
+        first_by_hash: Dict[str, str] = {}
+        file_hashes: Dict[str, List[str]] = {}
+        candidates: List[Tuple[str, int]] = []
+        direct: List[str] = []
+        for size, paths in size_buckets.items():
+            uncached: List[Tuple[str, int]] = []
+            for path in paths:
+                cached = hash_cache.get(path)
+                if cached and cached[0] == mtimes[path] and cached[1] == size and cached[2] == algorithm:
+                    _add_grouped(first_by_hash, file_hashes, cached[3], path)
+                else:
+                    uncached.append((path, size))
+            if len(uncached) < len(paths):
+                # Cache'dagi juftlarning tezkor hash'i yo'q - to'g'ridan-to'g'ri to'liq hash
+                direct.extend(path for path, _ in uncached)
+            else:
+                candidates.extend(uncached)
+        
+        new_rows = []
+        # Hash'lash GIL'ni bo'shatadi - thread'lar disk I/O va hash'ni ustma-ust bajaradi
+        with ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+            # 2-bosqich: boshi+oxiri 4 KiB tezkor hash
+            first_by_quick: Dict[Tuple[int, str], str] = {}
+            quick_groups: Dict[Tuple[int, str], List[str]] = {}
+            quick_hashes = executor.map(lambda item: _quick_hash(*item), candidates)
+            for (path, size), quick in zip(candidates, quick_hashes):
+                if quick is None:
                     continue
+                if size <= 2 * QUICK_HASH_SIZE:
+                    # Kichik file'lar uchun tezkor hash - to'liq hash
+                    new_rows.append((path, mtimes[path], size, algorithm, quick))
+                    _add_grouped(first_by_hash, file_hashes, quick, path)
+                else:
+                    _add_grouped(first_by_quick, quick_groups, (size, quick), path)
+            
+            # 3-bosqich: faqat tezkor hash'i to'qnashgan file'lar to'liq hash qilinadi
+            full_candidates = list(direct)
+            for paths in quick_groups.values():
+                full_candidates.extend(paths)
+            
+            for path, file_hash in zip(full_candidates, executor.map(_full_hash, full_candidates)):
+                if file_hash is not None:
+                    _add_grouped(first_by_hash, file_hashes, file_hash, path)
+                    new_rows.append((path, mtimes[path], sizes[path], algorithm, file_hash))
+        
+        self._save_cache('hashes', new_rows, list(sizes))
         
-        # Duplicate'larni topish
+        # Duplicate'larni topish (file_hashes'da faqat 2+ file'li guruhlar bor)
         for file_hash, files in file_hashes.items():
-            if len(files) > 1:
-                self.issues['duplicates'].append({
-                    'type': 'identical_files',
-                    'files': files,
-                    'hash': file_hash
-                })
+            files.sort()  # cache'li va yangi file'lar aralash - barqaror tartib
+            self.issues['duplicates'].append({
+                'type': 'identical_files',
+                'files': files,
+                'hash': file_hash
+            })
+    
+    def _scan_once(self) -> Dict[str, Any]:
+        """Loyihani bir marta aylanib, barcha bosqichlar uchun ro'yxatlarni to'plash"""
+        if self._scan is not None:
+            return self._scan
+        
+        files: List[Tuple[str, int]] = []
+        mtimes: Dict[str, int] = {}
+        py_files: List[str] = []
+        js_files: List[str] = []
+        cache_dirs: List[str] = []
+        configs: Dict[str, List[str]] = defaultdict(list)
+        
+        stack = [str(self.project_root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name in CACHE_DIRS:
+                                    cache_dirs.append(entry.path)
+                                # Ignore katalog'lar ichiga umuman kirilmaydi
+                                if entry.name not in IGNORE_DIRS:
+                                    stack.append(entry.path)
+                            elif entry.is_file():
+                                # Tahlil cache'ining o'zi (va WAL file'lari) tahlil qilinmaydi
+                                if entry.name.startswith(ANALYSIS_CACHE_NAME):
+                                    continue
+                                stat = entry.stat()
+                                files.append((entry.path, stat.st_size))
+                                mtimes[entry.path] = stat.st_mtime_ns
+                                suffix = os.path.splitext(entry.name)[1]
+                                if suffix == '.py':
+                                    py_files.append(entry.path)
+                                elif suffix in JS_SUFFIXES:
+                                    js_files.append(entry.path)
+                                if entry.name in CONFIG_NAMES:
+                                    configs[entry.name].append(entry.path)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        
+        self._scan = {
+            'files': files,
+            'mtimes': mtimes,
+            'py_files': py_files,
+            'js_files': js_files,
+            'cache_dirs': cache_dirs,
+            'configs': configs
+        }
+        return self._scan
+    
+    def _parse_python_files(self) -> Dict[str, Dict[str, Any]]:
+        """Barcha .py file'larni bir marta parse qilish (ko'p file bo'lsa process'larda)"""
+        if self._py_results is None:
+            scan = self._scan_once()
+            sizes = dict(scan['files'])
+            mtimes = scan['mtimes']
+            summary_cache = self._load_cache('ast_summaries')
+            algorithm = _hash_algorithm()
+            
+            # O'zgarmagan file'lar qayta o'qilmaydi va parse qilinmaydi
+            self._py_results = {}
+            paths = []
+            for path in scan['py_files']:
+                cached = summary_cache.get(path)
+                summary = None
+                if cached and cached[0] == mtimes[path] and cached[1] == sizes[path] and cached[2] == algorithm:
+                    summary = _load_summary(cached[3])
+                if summary is not None:
+                    self._py_results[path] = summary
+                else:
+                    paths.append(path)
+            
+            # Juda katta yoki generated modul'lar code duplicate qidiruvidan chetda
+            find_blocks = [
+                sizes[path] <= MAX_CODE_SCAN_SIZE and not _is_generated_source(path)
+                for path in paths
+            ]
+            if len(paths) >= PARALLEL_PARSE_MIN_FILES:
+                # chunksize pickle overhead'ini kamaytiradi
+                with ProcessPoolExecutor() as executor:
+                    results = list(executor.map(_analyze_py_file, paths, find_blocks, chunksize=32))
+            else:
+                results = [_analyze_py_file(path, flag) for path, flag in zip(paths, find_blocks)]
+            self._py_results.update(zip(paths, results))
+            
+            self._save_cache('ast_summaries', [
+                (path, mtimes[path], sizes[path], algorithm, _dump_summary(result))
+                for path, result in zip(paths, results)
+            ], scan['py_files'])
+        return self._py_results
     
-    def _find_duplicate_code(self):
+    def _open_cache(self) -> sqlite3.Connection:
+        """Tahlil cache DB'sini ochish (WAL - tez yozish uchun)"""
+        conn = sqlite3.connect(self.project_root / ANALYSIS_CACHE_NAME)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != CACHE_SCHEMA_VERSION:
+            # Eski sxemadagi summary'lar (MD5 code hash'lari) yaroqsiz
+            conn.execute("DROP TABLE IF EXISTS ast_summaries")
+            conn.execute(f"PRAGMA user_version = {CACHE_SCHEMA_VERSION}")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS hashes ("
+            "path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, algorithm TEXT, digest TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS ast_summaries ("
+            "path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, algorithm TEXT, summary BLOB)"
+        )
+        return conn
+    
+    def _load_cache(self, table: str) -> Dict[str, tuple]:
+        """Cache jadvalini {path: (mtime, size, ...)} ko'rinishida yuklash"""
+        if not (self.project_root / ANALYSIS_CACHE_NAME).exists():
+            return {}
+        try:
+            conn = self._open_cache()
+            try:
+                return {row[0]: row[1:] for row in conn.execute(f"SELECT * FROM {table}")}
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return {}
+    
+    def _save_cache(self, table: str, rows: List[tuple], seen_paths: List[str]) -> None:
+        """Yangi hisoblangan natijalarni yozish va shu walk'da uchramagan path'lar
+        qatorlarini o'chirish - bitta tranzaksiyada (jadval cheksiz o'smaydi)"""
+        if not rows and not (self.project_root / ANALYSIS_CACHE_NAME).exists():
+            return
+        try:
+            conn = self._open_cache()
+            try:
+                with conn:
+                    conn.execute("CREATE TEMP TABLE IF NOT EXISTS seen (path TEXT PRIMARY KEY)")
+                    conn.execute("DELETE FROM seen")
+                    conn.executemany("INSERT OR IGNORE INTO seen VALUES (?)", ((path,) for path in seen_paths))
+                    conn.execute(f"DELETE FROM {table} WHERE path NOT IN (SELECT path FROM seen)")
+                    if rows:
+                        placeholders = ", ".join("?" * len(rows[0]))
+                        conn.executemany(f"INSERT OR REPLACE INTO {table} VALUES ({placeholders})", rows)
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"  ⚠️  Tahlil cache'ini yozib bo'lmadi: {e}")
+    
+    def _find_duplicate_code(self) -> None:
         """Code duplicate'larini topish"""
         print("💾 Code duplicate'larni qidirayapman...")
         
-        python_files = list(self.project_root.rglob("*.py"))
-        code_blocks = defaultdict(list)
+        python_files = self._scan_once()['py_files']
+        py_results = self._parse_python_files()
+        first_blocks: Dict[str, Dict[str, Any]] = {}
+        code_blocks: Dict[str, List[Dict[str, Any]]] = {}
         
         for py_file in python_files:
             if self._should_ignore_file(py_file):
                 continue
-                
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                # Function'larni extract qilish
-                tree = ast.parse(content)
-                for node in ast.walk(tree):
-                    if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-                        code_snippet = ast.get_source_segment(content, node)
-                        if code_snippet and len(code_snippet) > 100:  # Kichik function'larni ignore
-                            code_hash = hashlib.md5(code_snippet.encode()).hexdigest()
-                            code_blocks[code_hash].append({
-                                'file': str(py_file),
-                                'name': node.name,
-                                'type': type(node).__name__,
-                                'line': node.lineno
-                            })
-            except:
-                continue
+            
+            # Function'larni extract qilish
+            for code_hash, name, node_type, line in py_results[py_file]['blocks']:
+                _add_grouped(first_blocks, code_blocks, code_hash, {
+                    'file': py_file,
+                    'name': name,
+                    'type': node_type,
+                    'line': line
+                })
         
-        # Duplicate code'larni topish
+        # Duplicate code'larni topish (code_blocks'da faqat takrorlanganlar bor)
         for code_hash, occurrences in code_blocks.items():
-            if len(occurrences) > 1:
-                self.issues['duplicates'].append({
-                    'type': 'duplicate_code',
-                    'occurrences': occurrences,
-                    'hash': code_hash
-                })
+            self.issues['duplicates'].append({
+                'type': 'duplicate_code',
+                'occurrences': occurrences,
+                'hash': code_hash
+            })
     
-    def _analyze_cache_issues(self):
+    def _analyze_cache_issues(self) -> None:
         """Cache muammolarini aniqlash"""
         print("🗂️  Cache muammolarini tekshirayapman...")
         
-        cache_dirs = [
-            '__pycache__',
-            '.pytest_cache', 
-            'node_modules',
-            '.next',
-            'dist',
-            'build',
-            '.cache'
-        ]
-        
-        for cache_dir in cache_dirs:
-            found_dirs = list(self.project_root.rglob(cache_dir))
-            for dir_path in found_dirs:
-                if dir_path.is_dir():
-                    size = self._get_directory_size(dir_path)
-                    self.issues['cache_issues'].append({
-                        'type': 'cache_directory',
-                        'path': str(dir_path),
-                        'size_mb': round(size / 1024 / 1024, 2)
-                    })
+        scan = self._scan_once()
+        for dir_path in scan['cache_dirs']:
+            size = self._get_directory_size(dir_path)
+            self.issues['cache_issues'].append({
+                'type': 'cache_directory',
+                'path': dir_path,
+                'size_mb': round(size / 1024 / 1024, 2)
+            })
         
         # Large files (potential cache issues)
-        for file_path in self.project_root.rglob("*"):
-            if file_path.is_file() and file_path.stat().st_size > 1024 * 1024:  # 1MB dan katta
+        for file_path, size in scan['files']:
+            if size > LARGE_FILE_SIZE:  # 1MB dan katta
                 self.issues['cache_issues'].append({
                     'type': 'large_file',
-                    'path': str(file_path),
-                    'size_mb': round(file_path.stat().st_size / 1024 / 1024, 2)
+                    'path': file_path,
+                    'size_mb': round(size / 1024 / 1024, 2)
                 })
     
-    def _check_architecture_violations(self):
+    def _check_architecture_violations(self) -> None:
         """Arxitektura violations'ni tekshirish"""
         print("🏗️  Arxitektura violations'ni tekshirayapman...")
         
@@ -164,112 +585,83 @@ class ProjectAnalyzer:
                     })
         
         # Import violations (backend files importing frontend)
-        python_files = list(self.project_root.rglob("*.py"))
+        python_files = self._scan_once()['py_files']
         for py_file in python_files:
-            if 'backend' in str(py_file):
+            # O'qib bo'lmaydigan file'lar exception ko'tarmasdan oldin o'tkazib yuboriladi
+            if 'backend' in py_file and os.access(py_file, os.R_OK):
                 try:
                     with open(py_file, 'r', encoding='utf-8') as f:
                         content = f.read()
                         if 'from frontend' in content or 'import frontend' in content:
                             self.issues['architecture_violations'].append({
                                 'type': 'cross_boundary_import',
-                                'file': str(py_file),
+                                'file': py_file,
                                 'violation': 'Backend importing from frontend'
                             })
-                except:
+                except (OSError, UnicodeDecodeError):
                     continue
     
-    def _check_naming_conventions(self):
+    def _check_naming_conventions(self) -> None:
         """Naming convention'larni tekshirish"""
         print("📝 Naming convention'larni tekshirayapman...")
         
         # Python files should be snake_case
-        python_files = list(self.project_root.rglob("*.py"))
+        scan = self._scan_once()
+        python_files = scan['py_files']
         for py_file in python_files:
-            filename = py_file.stem
-            if not re.match(r'^[a-z][a-z0-9_]*$', filename) and filename != '__init__':
+            filename = os.path.splitext(os.path.basename(py_file))[0]
+            if not _is_snake_case(filename) and filename != '__init__':
                 self.issues['naming_issues'].append({
                     'type': 'python_naming',
-                    'file': str(py_file),
+                    'file': py_file,
                     'issue': f'File name "{filename}" is not snake_case'
                 })
         
         # TypeScript/JavaScript files should be camelCase or kebab-case
-        js_files = list(self.project_root.rglob("*.tsx")) + list(self.project_root.rglob("*.ts")) + list(self.project_root.rglob("*.js"))
+        js_files = scan['js_files']
         for js_file in js_files:
-            filename = js_file.stem
-            if not re.match(r'^[a-z][a-zA-Z0-9]*$|^[a-z][a-z0-9-]*$', filename):
+            filename = os.path.splitext(os.path.basename(js_file))[0]
+            if not _JS_NAME_MATCH(filename):
                 self.issues['naming_issues'].append({
                     'type': 'js_naming', 
-                    'file': str(js_file),
+                    'file': js_file,
                     'issue': f'File name "{filename}" is not camelCase or kebab-case'
                 })
     
-    def _detect_import_cycles(self):
+    def _detect_import_cycles(self) -> None:
         """Import cycle'larni aniqlash"""
         print("🔄 Import cycle'larni qidirayapman...")
         
         import_graph = defaultdict(set)
-        python_files = list(self.project_root.rglob("*.py"))
         
-        for py_file in python_files:
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    tree = ast.parse(content)
-                    
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.Import):
-                            for alias in node.names:
-                                import_graph[str(py_file)].add(alias.name)
-                        elif isinstance(node, ast.ImportFrom):
-                            if node.module:
-                                import_graph[str(py_file)].add(node.module)
-            except:
-                continue
+        for path, result in self._parse_python_files().items():
+            for module in result['imports']:
+                import_graph[path].add(module)
         
         # Simple cycle detection (bu real implementation emas, basic check)
         # Real cycle detection uchun graph algorithms kerak
     
-    def _find_dead_code(self):
+    def _find_dead_code(self) -> None:
         """O'lik kod topish"""
         print("💀 Dead code'ni qidirayapman...")
         
         # Unused imports
-        python_files = list(self.project_root.rglob("*.py"))
-        for py_file in python_files:
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                # Basic unused import detection
-                import_lines = []
-                for line_num, line in enumerate(content.split('\n'), 1):
-                    if line.strip().startswith(('import ', 'from ')) and 'import' in line:
-                        import_lines.append((line_num, line.strip()))
-                
-                # Bu basic check, real implementation uchun AST analysis kerak
-                
-            except:
-                continue
+        for path, result in self._parse_python_files().items():
+            # Basic unused import detection
+            import_lines = result['import_lines']
+            
+            # Bu basic check, real implementation uchun AST analysis kerak
     
-    def _check_config_conflicts(self):
+    def _check_config_conflicts(self) -> None:
         """Config file'lardagi conflicts"""
         print("⚙️  Config conflicts'ni tekshirayapman...")
         
-        config_files = [
-            'package.json',
-            'pyproject.toml', 
-            'requirements.txt',
-            'tsconfig.json',
-            'next.config.mjs'
-        ]
-        
-        found_configs = {}
-        for config_file in config_files:
-            configs = list(self.project_root.rglob(config_file))
-            if len(configs) > 1:
-                found_configs[config_file] = [str(c) for c in configs]
+        # Config file'lar _scan_once walk'ida nom bo'yicha yig'ilgan
+        found_configs = {
+            config_file: sorted(paths)
+            for config_file, paths in self._scan_once()['configs'].items()
+            if len(paths) > 1
+        }
         
         if found_configs:
             self.issues['config_conflicts'].extend([
@@ -281,34 +673,31 @@ class ProjectAnalyzer:
                 for config_type, files in found_configs.items()
             ])
     
-    def _should_ignore_file(self, file_path: Path) -> bool:
-        """Ignore qilinadigan file'larni aniqlash"""
-        ignore_patterns = [
-            '__pycache__',
-            '.git',
-            '.next',
-            'node_modules',
-            '.pytest_cache',
-            'dist',
-            'build',
-            '.vscode',
-            '.idea',
-            '*.pyc',
-            '*.log'
-        ]
-        
-        str_path = str(file_path)
-        return any(pattern in str_path for pattern in ignore_patterns)
+    def _should_ignore_file(self, file_path: str) -> bool:
+        """Ignore qilinadigan file'larni aniqlash (frozenset bo'yicha, substring scan'siz)"""
+        # Katalog'lar walk paytida kesiladi; bu yerda faqat aniq nom/kengaytma tekshiriladi
+        if os.path.splitext(file_path)[1] in IGNORE_SUFFIXES:
+            return True
+        # project_root'dan yuqoridagi qismlar hisobga olinmaydi
+        return not IGNORE_DIRS.isdisjoint(file_path[self._root_prefix_len:].split(os.sep))
     
-    def _get_directory_size(self, directory: Path) -> int:
-        """Directory hajmini hisoblash"""
+    def _get_directory_size(self, directory: str) -> int:
+        """Directory hajmini hisoblash (os.scandir stack, Path obyektlarisiz)"""
         total_size = 0
-        for file_path in directory.rglob("*"):
-            if file_path.is_file():
-                try:
-                    total_size += file_path.stat().st_size
-                except:
-                    continue
+        stack = [os.fspath(directory)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                total_size += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            continue
+            except OSError:
+                continue
         return total_size
     
     def _generate_report(self) -> Dict[str, Any]:
@@ -350,7 +739,7 @@ class ProjectAnalyzer:
         
         return recommendations
 
-def main():
+def main() -> None:
     """Main function"""
     project_root = "/workspaces/ZeroDev_AI"
     analyzer = ProjectAnalyzer(project_root)
@@ -362,8 +751,14 @@ def main():
     report = analyzer.analyze()
     
     # Report'ni file'ga saqlash
-    with open(f"{project_root}/PROJECT_ANALYSIS_REPORT.json", 'w') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    report_path = f"{project_root}/PROJECT_ANALYSIS_REPORT.json"
+    if orjson_available:
+        # orjson UTF-8 bytes yozadi (ensure_ascii=False bilan bir xil)
+        with open(report_path, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
     
     # Summary print qilish
     print("\n" + "=" * 60)
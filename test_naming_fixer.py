@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Test for scripts/naming_fixer.py: dot-directories such as .github must never be renamed
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+
+from naming_fixer import NamingFixer  # noqa: E402
+
+
+def _dot_tree(root):
+    """All paths under .github and .vscode, relative to root"""
+    return sorted(
+        p.relative_to(root)
+        for p in root.rglob("*")
+        if ".github" in p.parts or ".vscode" in p.parts
+    )
+
+
+def test_dot_directories_are_not_renamed(tmp_path):
+    """Nothing under .github (or other dot-dirs) is renamed, the rest still is"""
+    workflows = tmp_path / ".github" / "workflows"
+    workflows.mkdir(parents=True)
+    (workflows / "CI_Build.yml").write_text("on: push\n")
+    (workflows / "Helper_Script.py").write_text("")
+    issue_templates = tmp_path / ".github" / "ISSUE_TEMPLATE"
+    issue_templates.mkdir()
+    (issue_templates / "Bug_Report.md").write_text("")
+    (tmp_path / ".vscode").mkdir()
+    (tmp_path / ".vscode" / "SettingsHelper.js").write_text("")
+    (tmp_path / "MyModule.py").write_text("")
+
+    before = _dot_tree(tmp_path)
+
+    fixer = NamingFixer(str(tmp_path))
+    fixer.fix_naming_issues()
+
+    after = _dot_tree(tmp_path)
+    assert after == before
+    assert not (tmp_path / "github").exists()
+    assert all(".github" not in fix["old"] and ".vscode" not in fix["old"] for fix in fixer.fixes_applied)
+    # Regular files are still fixed
+    assert (tmp_path / "my_module.py").exists()